@@ -66,8 +66,17 @@ class CircuitBreakerStateMachine:
         failure_threshold: int,
         success_threshold: int,
         timeout_duration: float,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
-        """Initialize state manager."""
+        """Initialize state manager.
+
+        Args:
+            name: Name for logging and identification
+            failure_threshold: Number of failures before opening circuit
+            success_threshold: Number of successes in half-open before closing
+            timeout_duration: Seconds to wait before trying half-open
+            clock: Monotonic time source in seconds, injectable for tests
+        """
         self.name = name
         self.failure_threshold = failure_threshold
         self.success_threshold = success_threshold
@@ -76,12 +85,13 @@ class CircuitBreakerStateMachine:
         self.failure_count = 0
         self.success_count = 0
         self.last_failure_time: float | None = None
+        self._clock = clock
         self._lock = asyncio.Lock()
 
     async def transition_to_open(self) -> None:
         """Transition to OPEN state."""
         self.state = CircuitBreakerState.OPEN
-        self.last_failure_time = time.time()
+        self.last_failure_time = self._clock()
         self.success_count = 0
         logger.error(
             "Circuit breaker '{name}' opened after {count} failures",
@@ -106,7 +116,7 @@ class CircuitBreakerStateMachine:
         """Check if enough time has passed to attempt reset."""
         if self.last_failure_time is None:
             return False
-        return time.time() - self.last_failure_time >= self.timeout_duration
+        return self._clock() - self.last_failure_time >= self.timeout_duration
 
     async def on_success(self) -> None:
         """Handle successful call.
@@ -175,6 +185,7 @@ class CircuitBreaker:
         *,
         timeout_duration: float = 60.0,
         expected_exceptions: tuple[type[Exception], ...] | None = None,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         """
         Initialize circuit breaker.
@@ -185,6 +196,7 @@ class CircuitBreaker:
             success_threshold: Number of successes in half-open before closing
             timeout_duration: Seconds to wait before trying half-open
             expected_exceptions: Exceptions that trigger the circuit breaker
+            clock: Monotonic time source in seconds, injectable for tests
         """
         self.name = name
         self.expected_exceptions = expected_exceptions or (
@@ -192,7 +204,9 @@ class CircuitBreaker:
             ConnectionError,
             TimeoutError,
         )
-        self.state_manager = CircuitBreakerStateMachine(name, failure_threshold, success_threshold, timeout_duration)
+        self.state_manager = CircuitBreakerStateMachine(
+            name, failure_threshold, success_threshold, timeout_duration, clock
+        )
 
     async def _execute_function(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         """Execute the function with proper async handling."""
@@ -216,6 +230,33 @@ class CircuitBreaker:
             ExternalServiceError: When circuit is open
             Exception: Whatever func raises
         """
+        state_manager = self.state_manager
+
+        # A CLOSED breaker has no transition to check and never rejects, so skip the lock
+        if state_manager.state is not CircuitBreakerState.CLOSED:
+            await self._reject_if_open()
+
+        # Attempt the call
+        try:
+            result = await self._execute_function(func, *args, **kwargs)
+        except self.expected_exceptions:
+            # Hold lock during state update to prevent race condition
+            async with state_manager._lock:
+                await state_manager.on_failure()
+            raise
+
+        # Success in a clean CLOSED state changes nothing, so only lock when there is state to update
+        if state_manager.state is not CircuitBreakerState.CLOSED or state_manager.failure_count:
+            async with state_manager._lock:
+                await state_manager.on_success()
+        return result
+
+    async def _reject_if_open(self) -> None:
+        """Apply any pending OPEN -> HALF_OPEN transition and reject if still open.
+
+        Raises:
+            ExternalServiceError: When circuit is open
+        """
         async with self.state_manager._lock:
             await self.state_manager.check_state_transition()
 
@@ -229,20 +270,6 @@ class CircuitBreaker:
                     },
                 )
 
-        # Attempt the call
-        try:
-            result = await self._execute_function(func, *args, **kwargs)
-            # Hold lock during state update to prevent race condition
-            async with self.state_manager._lock:
-                await self.state_manager.on_success()
-            return result
-
-        except self.expected_exceptions:
-            # Hold lock during state update to prevent race condition
-            async with self.state_manager._lock:
-                await self.state_manager.on_failure()
-            raise
-
     def __call__(self, func: Callable[..., Any]) -> Callable[..., Any]:
         """
         Decorator to wrap function with circuit breaker.
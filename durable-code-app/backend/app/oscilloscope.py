@@ -18,6 +18,7 @@ import json
 import math
 import random
 import time
+from collections.abc import Callable
 from datetime import datetime
 from enum import Enum
 from typing import Any
@@ -86,18 +87,40 @@ class WaveType(str, Enum):
 
 
 class WebSocketRateLimiter:
-    """Rate limiter for WebSocket connections to prevent resource exhaustion."""
+    """Rate limiter for new WebSocket connections to prevent resource exhaustion.
+
+    Each IP gets a token bucket holding up to max_connections_per_window
+    tokens that refills continuously at max_connections_per_window per
+    window, so bursts are capped and sustained reconnects are throttled. A
+    check is O(1) with no per-connection timestamp lists to filter. This
+    limits the rate of new connections, not how many stay open; closing a
+    connection does not return its token.
+    """
 
-    def __init__(self, max_connections_per_ip: int = 5, window_seconds: float = 60.0) -> None:
+    def __init__(
+        self,
+        max_connections_per_window: int = 5,
+        window_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         """Initialize rate limiter.
 
         Args:
-            max_connections_per_ip: Maximum concurrent connections per IP
+            max_connections_per_window: Maximum new connections per IP within one window
             window_seconds: Time window for rate limiting in seconds
+            clock: Monotonic time source in seconds, injectable for tests
         """
-        self.max_connections = max_connections_per_ip
+        self.max_connections_per_window = max_connections_per_window
         self.window = window_seconds
-        self.connections: dict[str, list[float]] = {}
+        self._refill_rate = max_connections_per_window / window_seconds
+        # client_ip -> (available tokens, monotonic time of last refill)
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._clock = clock
+
+    def _refill(self, client_ip: str, now: float) -> float:
+        """Get the tokens available to an IP after refilling up to now."""
+        tokens, last = self._buckets.get(client_ip, (self.max_connections_per_window, now))
+        return min(self.max_connections_per_window, tokens + (now - last) * self._refill_rate)
 
     def check_rate_limit(self, client_ip: str) -> bool:
         """Check if client is within rate limits.
@@ -108,41 +131,25 @@ class WebSocketRateLimiter:
         Returns:
             True if client is within limits, False if rate limit exceeded
         """
-        now = time.time()
-
-        # Initialize or clean old connections for this IP
-        if client_ip not in self.connections:
-            self.connections[client_ip] = []
-
-        # Remove connections outside the time window
-        self.connections[client_ip] = [
-            conn_time for conn_time in self.connections[client_ip] if now - conn_time < self.window
-        ]
+        now = self._clock()
+        tokens = self._refill(client_ip, now)
 
         # Check if limit exceeded
-        if len(self.connections[client_ip]) >= self.max_connections:
-            logger.warning("Rate limit exceeded", client_ip=client_ip, count=len(self.connections[client_ip]))
+        if tokens < 1:
+            self._buckets[client_ip] = (tokens, now)
+            logger.warning("Rate limit exceeded", client_ip=client_ip, tokens=round(tokens, 2))
             return False
 
-        # Add this connection
-        self.connections[client_ip].append(now)
+        # Take a token for this connection
+        self._buckets[client_ip] = (tokens - 1, now)
         return True
 
-    def release_connection(self, client_ip: str) -> None:
-        """Release a connection slot for an IP address.
-
-        Args:
-            client_ip: Client IP address
-        """
-        if client_ip in self.connections and self.connections[client_ip]:
-            self.connections[client_ip].pop()
-
 
 # Global rate limiter instance
-# Note: Increased from 5 to 50 connections to support demo usage patterns
-# where users frequently refresh or reconnect. This still provides protection
-# against abuse while allowing normal demo interaction.
-_websocket_rate_limiter = WebSocketRateLimiter(max_connections_per_ip=50, window_seconds=60.0)
+# Note: Increased from 5 to 50 new connections per minute to support demo usage
+# patterns where users frequently refresh or reconnect. This still provides
+# protection against abuse while allowing normal demo interaction.
+_websocket_rate_limiter = WebSocketRateLimiter(max_connections_per_window=50, window_seconds=60.0)
 
 
 class OscilloscopeCommand(BaseModel):
@@ -421,15 +428,14 @@ async def _run_stream_loop(
             await asyncio.sleep(IDLE_SLEEP_DURATION)
 
 
-async def _cleanup_connection(state_machine: WebSocketStateMachine, client_ip: str) -> None:
-    """Clean up connection state and release resources."""
+async def _cleanup_connection(state_machine: WebSocketStateMachine) -> None:
+    """Clean up connection state."""
     if not state_machine.is_disconnected():
         # First transition to disconnecting state if not already
         state_machine.disconnect()
         # Then complete the disconnect
         if not state_machine.is_disconnected():
             state_machine.complete_disconnect()
-    _websocket_rate_limiter.release_connection(client_ip)
 
 
 async def _dispatch_exception_handler(
@@ -463,7 +469,7 @@ async def _handle_stream_errors(
     except (WebSocketDisconnect, OSError, ValueError, TypeError) as exception:
         await _dispatch_exception_handler(exception, websocket, state_machine, client_ip)
     finally:
-        await _cleanup_connection(state_machine, client_ip)
+        await _cleanup_connection(state_machine)
 
 
 @router.websocket("/stream")
@@ -38,6 +38,7 @@ from .domain.generator import (
 
 # Re-export geometry functions
 from .geometry.boundaries import (
+    build_track_boundary,
     calculate_normal_offset,
     generate_boundaries_from_centerline,
     generate_track_boundaries,
@@ -48,13 +49,22 @@ from .geometry.curves import (
     normalize_angle,
     smooth_track_centerline,
 )
-from .models import Point2D, SimpleTrack, TrackBoundary, TrackGenerationParams
+from .models import (
+    Point2D,
+    SimpleTrack,
+    SimpleTrackCompact,
+    TrackBoundary,
+    TrackBoundaryCompact,
+    TrackGenerationParams,
+)
 
 # Re-export types and constants
 from .types import (
+    COMPACT_COORDINATE_DECIMALS,
     DEFAULT_TRACK_HEIGHT,
     DEFAULT_TRACK_PADDING,
     DEFAULT_TRACK_WIDTH,
+    DIFFICULTY_CONFIGS,
     DIFFICULTY_PARAMS,
     HTTP_BAD_REQUEST,
     HTTP_NOT_FOUND,
@@ -70,7 +80,9 @@ __all__ = [
     # Models
     "Point2D",
     "TrackBoundary",
+    "TrackBoundaryCompact",
     "SimpleTrack",
+    "SimpleTrackCompact",
     "TrackGenerationParams",
     # Types
     "Point",
@@ -81,8 +93,10 @@ __all__ = [
     "MAX_TRACK_WIDTH",
     "MIN_TRACK_HEIGHT",
     "MAX_TRACK_HEIGHT",
+    "COMPACT_COORDINATE_DECIMALS",
     "DEFAULT_TRACK_PADDING",
     "DIFFICULTY_PARAMS",
+    "DIFFICULTY_CONFIGS",
     "HTTP_BAD_REQUEST",
     "HTTP_NOT_FOUND",
     # Geometry - Curves
@@ -91,6 +105,7 @@ __all__ = [
     "interpolate_centerline",
     "normalize_angle",
     # Geometry - Boundaries
+    "build_track_boundary",
     "calculate_normal_offset",
     "generate_track_boundaries",
     "generate_boundaries_from_centerline",
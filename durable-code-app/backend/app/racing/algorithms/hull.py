@@ -4,12 +4,13 @@ Purpose: Compute concave hull of point sets
 Scope: k-nearest neighbors based hull algorithm
 Overview: Implementation of concave hull algorithm using k-nearest neighbors
     approach. Used for creating closed track shapes from scattered points.
-Dependencies: Standard library math
+Dependencies: Standard library heapq, math
 Exports: compute_concave_hull, find_k_nearest, select_best_candidate
 Interfaces: Pure functions for hull computation
 Implementation: k-NN based concave hull with angle-based point selection
 """
 
+import heapq
 import math
 
 from ..geometry.curves import normalize_angle
@@ -26,9 +27,8 @@ def find_k_nearest(current: tuple[float, float], points_set: set, k: int) -> lis
     Returns:
         List of k nearest points
     """
-    distances = [(p, math.sqrt((p[0] - current[0]) ** 2 + (p[1] - current[1]) ** 2)) for p in points_set]
-    distances.sort(key=lambda x: x[1])
-    return [p for p, _ in distances[: min(k, len(distances))]]
+    # Partial selection is O(n log k) and returns the same order as a full sort
+    return heapq.nsmallest(k, points_set, key=lambda p: math.dist(p, current))
 
 
 def select_best_candidate(
@@ -53,18 +53,13 @@ def select_best_candidate(
         return candidates[0]
 
     ref_angle = math.atan2(current[1] - prev[1], current[0] - prev[0])
-    best_angle = -math.pi
-    best_candidate = candidates[0]
+    current_x, current_y = current
 
-    for candidate in candidates:
-        angle = math.atan2(candidate[1] - current[1], candidate[0] - current[0])
-        relative_angle = normalize_angle(angle - ref_angle)
+    def relative_angle(candidate: tuple[float, float]) -> float:
+        return normalize_angle(math.atan2(candidate[1] - current_y, candidate[0] - current_x) - ref_angle)
 
-        if relative_angle > best_angle:
-            best_angle = relative_angle
-            best_candidate = candidate
-
-    return best_candidate
+    # max() keeps the first of equal maxima, matching the previous strict ">" scan
+    return max(candidates, key=relative_angle)
 
 
 def _should_close_hull(next_point: tuple[float, float], start: tuple[float, float], hull_length: int) -> bool:
@@ -72,18 +67,17 @@ def _should_close_hull(next_point: tuple[float, float], start: tuple[float, floa
     return next_point == start and hull_length > 2
 
 
-def _is_hull_too_large(hull_length: int, total_points: int) -> bool:
-    """Check if hull has grown too large (safety check)."""
-    return hull_length > total_points * 2
-
-
 def _build_hull_iteratively(
     start: tuple[float, float],
     points_set: set[tuple[float, float]],
     k: int,
-    max_points: int,
 ) -> list[tuple[float, float]]:
-    """Build concave hull iteratively using k-nearest neighbors."""
+    """Build concave hull iteratively using k-nearest neighbors.
+
+    Candidates are always drawn from points_set and the accepted point is
+    removed from it, so every iteration consumes one point and the loop
+    terminates after at most len(points_set) iterations.
+    """
     hull = [start]
     current = start
 
@@ -100,10 +94,7 @@ def _build_hull_iteratively(
 
         hull.append(next_point)
         current = next_point
-        points_set.discard(next_point)
-
-        if _is_hull_too_large(len(hull), max_points):
-            break
+        points_set.remove(next_point)
 
     return hull
 
@@ -130,4 +121,4 @@ def compute_concave_hull(points: list[tuple[float, float]], k: int = 3) -> list[
     points_set = set(points)
     points_set.remove(start)
 
-    return _build_hull_iteratively(start, points_set, k, len(points))
+    return _build_hull_iteratively(start, points_set, k)
@@ -7,20 +7,39 @@ Overview: Specialized track generators for specific shapes and patterns,
 Dependencies: Standard library math, geometry functions
 Exports: generate_figure8_track
 Interfaces: Track layout generation functions
-Implementation: Parametric equations for special shapes
+Implementation: Parametric equations for special shapes, precomputed for fixed shapes
 """
 
 import math
 
-from ..geometry.boundaries import TrackBoundary
-from ..geometry.curves import interpolate_centerline, smooth_track_centerline
+from ..geometry.boundaries import TrackBoundary, build_track_boundary
+
+_FIGURE8_NUM_POINTS = 32
+
+
+def _figure8_unit_offset(index: int) -> tuple[float, float]:
+    """Offset of a figure-8 control point from the canvas center, in units of radius."""
+    angle = (2 * math.pi * index) / _FIGURE8_NUM_POINTS
+
+    if index < _FIGURE8_NUM_POINTS // 2:
+        # Upper loop
+        return (1.2 * math.cos(angle * 2), -0.8 - 0.8 * math.sin(angle * 2))
+
+    # Lower loop
+    angle_offset = angle - math.pi
+    return (1.2 * math.cos(angle_offset * 2), 0.8 + 0.8 * math.sin(angle_offset * 2))
+
+
+# The figure-8 shape is fixed; only center and radius vary per request
+_FIGURE8_UNIT_OFFSETS = tuple(_figure8_unit_offset(i) for i in range(_FIGURE8_NUM_POINTS))
 
 
 def generate_figure8_track(width: int, height: int, track_width: float) -> TrackBoundary:
     """Generate a figure-8 style track with crossover.
 
     Creates a track in the shape of a figure-8 using parametric equations
-    for two overlapping loops.
+    for two overlapping loops. The parametric shape is evaluated once at
+    import time and scaled to the canvas per call.
 
     Args:
         width: Canvas width
@@ -34,31 +53,7 @@ def generate_figure8_track(width: int, height: int, track_width: float) -> Track
     radius = min(width, height) / 4
 
     # Create figure-8 shape with two loops
-    control_points = []
-    num_points = 32
-
-    for i in range(num_points):
-        angle = (2 * math.pi * i) / num_points
-
-        # Create figure-8 using parametric equations
-        if i < num_points // 2:
-            # Upper loop
-            x = center_x + radius * 1.2 * math.cos(angle * 2)
-            y = center_y - radius * 0.8 - radius * 0.8 * math.sin(angle * 2)
-        else:
-            # Lower loop
-            angle_offset = angle - math.pi
-            x = center_x + radius * 1.2 * math.cos(angle_offset * 2)
-            y = center_y + radius * 0.8 + radius * 0.8 * math.sin(angle_offset * 2)
-
-        control_points.append((x, y))
+    control_points = [(center_x + radius * dx, center_y + radius * dy) for dx, dy in _FIGURE8_UNIT_OFFSETS]
 
     # Generate smooth centerline and boundaries
-    smoothed = smooth_track_centerline(control_points)
-    centerline = interpolate_centerline(smoothed)
-
-    # Use the boundaries generation function
-    from ..geometry.boundaries import generate_track_boundaries
-
-    outer, inner = generate_track_boundaries(centerline, track_width)
-    return TrackBoundary(outer=outer, inner=inner)
+    return build_track_boundary(control_points, track_width)
@@ -35,6 +35,8 @@ def generate_random_track_points(
         List of well-spaced random points
     """
     points: list[tuple[float, float]] = []
+    # Compare squared distances so the spacing check needs no square root
+    min_spacing_sq = min_spacing * min_spacing
 
     for _ in range(num_points):
         # Try up to 1000 times to find a valid point
@@ -43,14 +45,12 @@ def generate_random_track_points(
             angle = random.uniform(0, 2 * math.pi)  # noqa: S311  # nosec B311
             r = random.uniform(0.3, 1.0)  # noqa: S311  # nosec B311
 
-            pt = (
-                center[0] + max_radius[0] * r * math.cos(angle),
-                center[1] + max_radius[1] * r * math.sin(angle),
-            )
+            x = center[0] + max_radius[0] * r * math.cos(angle)
+            y = center[1] + max_radius[1] * r * math.sin(angle)
 
             # Check spacing constraint
-            if all(math.sqrt((pt[0] - e[0]) ** 2 + (pt[1] - e[1]) ** 2) >= min_spacing for e in points):
-                points.append(pt)
+            if all((x - ex) * (x - ex) + (y - ey) * (y - ey) >= min_spacing_sq for ex, ey in points):
+                points.append((x, y))
                 break
 
     return points
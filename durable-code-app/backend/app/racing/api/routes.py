@@ -7,9 +7,15 @@ Overview: This module contains the FastAPI route handlers for the racing
 Dependencies: FastAPI, Pydantic models, domain generators
 Exports: FastAPI router with racing endpoints
 Interfaces: REST API endpoints for track data
-Implementation: Async route handlers with comprehensive validation
+Implementation: Async route handlers with comprehensive validation; CPU-bound
+    track generation runs in a worker thread so it does not block the event loop,
+    and deterministic layouts are memoized so repeat requests skip generation
 """
 
+import asyncio
+import dataclasses
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import APIRouter, HTTPException, Query
@@ -24,12 +30,12 @@ from app.famous_tracks import (
 )
 
 from ..domain.generator import generate_oval_track, generate_procedural_track
-from ..geometry.boundaries import generate_boundaries_from_centerline
-from ..models import Point2D, SimpleTrack, TrackBoundary, TrackGenerationParams
+from ..geometry.boundaries import build_track_boundary
+from ..models import Point2D, SimpleTrack, SimpleTrackCompact, TrackBoundary, TrackGenerationParams
 from ..types import (
     DEFAULT_TRACK_HEIGHT,
-    DEFAULT_TRACK_PADDING,
     DEFAULT_TRACK_WIDTH,
+    DIFFICULTY_CONFIGS,
     DIFFICULTY_PARAMS,
     HTTP_BAD_REQUEST,
     HTTP_NOT_FOUND,
@@ -66,84 +72,116 @@ def _select_track_layout(params: TrackGenerationParams, track_width: float) -> T
     Raises:
         ValueError: If layout generator fails
     """
-    layout_generators = {
-        "figure8": lambda: _generate_figure8_layout(params, track_width),
-        "spa": lambda: _generate_spa_layout(params, track_width),
-        "monaco": lambda: _generate_monaco_layout(params, track_width),
-        "laguna": lambda: _generate_laguna_layout(params, track_width),
-        "suzuka": lambda: _generate_suzuka_layout(params, track_width),
-    }
+    if params.layout in _LAYOUT_GENERATORS:
+        return _generate_named_layout(params.layout, params.width, params.height, track_width)
 
-    if params.layout in layout_generators:
-        return layout_generators[params.layout]()
+    config = _procedural_config(params)
+    return generate_procedural_track(params.width, params.height, params.difficulty, config, seed=params.seed)
 
-    # Build TrackConfig from params
-    difficulty_config = DIFFICULTY_PARAMS[params.difficulty]
-    variation = params.variation_amount if params.variation_amount is not None else difficulty_config["variation"]
-    num_points = params.num_points if params.num_points is not None else difficulty_config["num_points"]
 
-    config = TrackConfig(
-        width=params.width,
-        height=params.height,
-        track_width=params.track_width_override if params.track_width_override is not None else track_width,
-        padding=DEFAULT_TRACK_PADDING,
-        num_control_points=int(num_points),
-        variation_amount=float(variation),
-        hairpin_chance=params.hairpin_chance if params.hairpin_chance is not None else 0.2,
-        hairpin_intensity=params.hairpin_intensity if params.hairpin_intensity is not None else 2.5,
-        smoothing_passes=params.smoothing_passes if params.smoothing_passes is not None else 2,
-    )
+@lru_cache(maxsize=64)
+def _generate_named_layout(layout: str, width: int, height: int, track_width: float) -> TrackBoundary:
+    """Generate a fixed layout, caching the result.
+
+    Named layouts are fully determined by their dimensions and track width,
+    so repeat requests share one instance. Sharing is safe because
+    TrackBoundary is frozen and holds its points in tuples of frozen
+    Point2D models, so no request can alter the cached geometry.
+    """
+    return _LAYOUT_GENERATORS[layout](width, height, track_width)
+
 
-    return generate_procedural_track(params.width, params.height, params.difficulty, config)
+# TrackGenerationParams field -> TrackConfig field for optional procedural overrides
+_CONFIG_OVERRIDE_FIELDS = {
+    "width": "width",
+    "height": "height",
+    "track_width_override": "track_width",
+    "num_points": "num_control_points",
+    "variation_amount": "variation_amount",
+    "hairpin_chance": "hairpin_chance",
+    "hairpin_intensity": "hairpin_intensity",
+    "smoothing_passes": "smoothing_passes",
+}
 
 
-def _generate_figure8_layout(params: TrackGenerationParams, track_width: float) -> TrackBoundary:
+def _procedural_config(params: TrackGenerationParams) -> TrackConfig:
+    """Get the TrackConfig for a procedural request.
+
+    Starts from the prebuilt config for the difficulty and only builds a new
+    one when the request sets a value that differs from it.
+
+    Args:
+        params: Track generation parameters
+
+    Returns:
+        TrackConfig for the requested difficulty and overrides
+    """
+    base = DIFFICULTY_CONFIGS[params.difficulty]
+    overrides = {
+        config_field: value
+        for param_field, config_field in _CONFIG_OVERRIDE_FIELDS.items()
+        if (value := getattr(params, param_field)) is not None and value != getattr(base, config_field)
+    }
+    return dataclasses.replace(base, **overrides) if overrides else base
+
+
+def _generate_figure8_layout(width: int, height: int, track_width: float) -> TrackBoundary:
     """Generate figure-8 track layout."""
     from ..algorithms.layouts import generate_figure8_track
 
-    return generate_figure8_track(params.width, params.height, track_width)
+    return generate_figure8_track(width, height, track_width)
 
 
-def _generate_spa_layout(params: TrackGenerationParams, track_width: float) -> TrackBoundary:
+def _generate_spa_layout(width: int, height: int, track_width: float) -> TrackBoundary:
     """Generate Spa-inspired track layout."""
     return generate_spa_inspired_track(
-        params.width,
-        params.height,
+        width,
+        height,
         track_width,
-        generate_boundaries_from_centerline,  # type: ignore[arg-type]
+        build_track_boundary,
     )
 
 
-def _generate_monaco_layout(params: TrackGenerationParams, track_width: float) -> TrackBoundary:
+def _generate_monaco_layout(width: int, height: int, track_width: float) -> TrackBoundary:
     """Generate Monaco-style track layout."""
     return generate_monaco_style_track(
-        params.width,
-        params.height,
+        width,
+        height,
         track_width,
-        generate_boundaries_from_centerline,  # type: ignore[arg-type]
+        build_track_boundary,
     )
 
 
-def _generate_laguna_layout(params: TrackGenerationParams, track_width: float) -> TrackBoundary:
+def _generate_laguna_layout(width: int, height: int, track_width: float) -> TrackBoundary:
     """Generate Laguna Seca track layout."""
     return generate_laguna_seca_track(
-        params.width,
-        params.height,
+        width,
+        height,
         track_width,
-        generate_boundaries_from_centerline,  # type: ignore[arg-type]
+        build_track_boundary,
     )
 
 
-def _generate_suzuka_layout(params: TrackGenerationParams, track_width: float) -> TrackBoundary:
+def _generate_suzuka_layout(width: int, height: int, track_width: float) -> TrackBoundary:
     """Generate Suzuka-style track layout."""
     return generate_suzuka_style_track(
-        params.width,
-        params.height,
+        width,
+        height,
         track_width,
-        generate_boundaries_from_centerline,  # type: ignore[arg-type]
+        build_track_boundary,
     )
 
 
+# Generators for the fixed (non-procedural) layouts, keyed by layout name
+_LAYOUT_GENERATORS: dict[str, Callable[[int, int, float], TrackBoundary]] = {
+    "figure8": _generate_figure8_layout,
+    "spa": _generate_spa_layout,
+    "monaco": _generate_monaco_layout,
+    "laguna": _generate_laguna_layout,
+    "suzuka": _generate_suzuka_layout,
+}
+
+
 def _find_bottom_boundary_points(
     boundaries: TrackBoundary, center_x: float, bottom_threshold: float
 ) -> tuple[list[Point2D], list[Point2D]]:
@@ -232,9 +270,8 @@ async def get_simple_track(
         raise HTTPException(status_code=HTTP_BAD_REQUEST, detail="Failed to generate track") from e
 
 
-@router.post("/track/generate", response_model=SimpleTrack)
-async def generate_track(params: TrackGenerationParams) -> SimpleTrack:
-    """Generate a procedural track based on parameters.
+async def _build_track(params: TrackGenerationParams) -> SimpleTrack:
+    """Generate track data shared by the track generation endpoints.
 
     Args:
         params: Track generation parameters including difficulty, seed, and layout
@@ -244,11 +281,6 @@ async def generate_track(params: TrackGenerationParams) -> SimpleTrack:
 
     Raises:
         HTTPException: If track generation fails
-
-    Note:
-        If a seed is provided, it creates an instance-level Random object
-        to avoid manipulating global random state, which could affect other
-        parts of the application.
     """
     logger.info(
         "Generating track",
@@ -259,11 +291,6 @@ async def generate_track(params: TrackGenerationParams) -> SimpleTrack:
         layout=params.layout,
     )
 
-    # Note: Removed global random.seed() call to avoid manipulating application-wide
-    # random state. The seed parameter is kept for API compatibility but currently
-    # not used. Full implementation of seeded random generation would require
-    # passing an RNG instance through the call chain (future enhancement in PR3).
-
     try:
         with _tracer.start_as_current_span(
             "racing.generate_procedural_track",
@@ -275,7 +302,8 @@ async def generate_track(params: TrackGenerationParams) -> SimpleTrack:
             },
         ):
             track_width = DIFFICULTY_PARAMS[params.difficulty]["track_width"]
-            boundaries = _select_track_layout(params, track_width)
+            # Generation is pure CPU work; keep the event loop free for other requests
+            boundaries = await asyncio.to_thread(_select_track_layout, params, track_width)
             start_position = _calculate_start_position(boundaries, params.width, params.height)
 
         return SimpleTrack(
@@ -293,6 +321,48 @@ async def generate_track(params: TrackGenerationParams) -> SimpleTrack:
         raise HTTPException(status_code=HTTP_BAD_REQUEST, detail="Failed to generate track boundaries") from e
 
 
+@router.post("/track/generate", response_model=SimpleTrack)
+async def generate_track(params: TrackGenerationParams) -> SimpleTrack:
+    """Generate a procedural track based on parameters.
+
+    Args:
+        params: Track generation parameters including difficulty, seed, and layout
+
+    Returns:
+        Generated track data with specified layout
+
+    Raises:
+        HTTPException: If track generation fails
+
+    Note:
+        If a seed is provided, procedural generation uses its own seeded
+        Random instance rather than global random state, so identical
+        requests produce identical (cached) tracks. Named layouts are
+        deterministic and cached by dimensions and track width.
+    """
+    return await _build_track(params)
+
+
+@router.post("/track/generate/compact", response_model=SimpleTrackCompact)
+async def generate_track_compact(params: TrackGenerationParams) -> SimpleTrackCompact:
+    """Generate a track with boundaries encoded as flat coordinate arrays.
+
+    Accepts the same parameters as /track/generate and returns the same
+    track, but each boundary is sent as separate x and y float lists
+    instead of a list of point objects.
+
+    Args:
+        params: Track generation parameters including difficulty, seed, and layout
+
+    Returns:
+        Generated track data in the compact format
+
+    Raises:
+        HTTPException: If track generation fails
+    """
+    return SimpleTrackCompact.from_track(await _build_track(params))
+
+
 @router.get("/health")
 async def health_check() -> dict[str, str]:
     """Health check endpoint for the racing API.
@@ -12,12 +12,35 @@ Implementation: Procedural generation with parametric control
 
 import math
 import random
+from functools import lru_cache
 
-from ..geometry.boundaries import generate_track_boundaries
-from ..geometry.curves import interpolate_centerline, smooth_track_centerline
-from ..models import Point2D, TrackBoundary
+from ..geometry.boundaries import build_track_boundary
+from ..models import TrackBoundary, points_from_coords
 from ..types import TrackConfig
 
+# Shared generator for unseeded requests; kept separate from the global random state
+_UNSEEDED_RNG = random.Random()  # noqa: S311  # nosec B311
+
+# Offset direction for alternating features, indexed by idx & 1
+_ALTERNATING_DIRECTIONS = (1, -1)
+
+
+@lru_cache(maxsize=32)
+def _unit_circle(num_points: int) -> tuple[tuple[float, float], ...]:
+    """Get (cos, sin) pairs for num_points evenly spaced angles.
+
+    The table depends only on the point count, so it is computed once per
+    count and shared by every generator that walks around the circle.
+
+    Args:
+        num_points: Number of evenly spaced angles
+
+    Returns:
+        Tuple of (cos, sin) pairs starting at angle 0
+    """
+    angles = ((2 * math.pi * i) / num_points for i in range(num_points))
+    return tuple((math.cos(angle), math.sin(angle)) for angle in angles)
+
 
 def generate_control_points_radial(
     num_points: int,
@@ -30,6 +53,7 @@ def generate_control_points_radial(
     height: int,
     padding: int,
     track_width: float,
+    rng: random.Random = _UNSEEDED_RNG,
 ) -> list[tuple[float, float]]:
     """Generate control points with radial variation.
 
@@ -47,21 +71,26 @@ def generate_control_points_radial(
         height: Canvas height
         padding: Edge padding
         track_width: Track width for bounds checking
+        rng: Random source for variations (seeded for reproducible tracks)
 
     Returns:
         List of control points as (x, y) tuples
     """
     control_points = []
     min_radius = padding + track_width
+    max_radius_x = width / 2 - padding
+    max_radius_y = height / 2 - padding
 
-    for i in range(num_points):
-        angle = (2 * math.pi * i) / num_points
+    # Bind the draw methods once; the draw order is unchanged so seeded tracks are stable
+    uniform = rng.uniform
+    chance = rng.random
 
+    for cos_angle, sin_angle in _unit_circle(num_points):
         # Generate random variation (not cryptographic use)
-        variation = random.uniform(-variation_amount, variation_amount)  # noqa: S311  # nosec B311
+        variation = uniform(-variation_amount, variation_amount)
 
         # Apply hairpin intensity randomly
-        if random.random() < hairpin_chance:  # noqa: S311  # nosec B311
+        if chance() < hairpin_chance:
             variation *= hairpin_intensity
 
         # Calculate radius with variation
@@ -69,12 +98,12 @@ def generate_control_points_radial(
         r_y = base_radius[1] * (1 + variation)
 
         # Clamp to canvas bounds
-        r_x = max(min_radius, min(width / 2 - padding, r_x))
-        r_y = max(min_radius, min(height / 2 - padding, r_y))
+        r_x = max(min_radius, min(max_radius_x, r_x))
+        r_y = max(min_radius, min(max_radius_y, r_y))
 
         # Calculate point position
-        x = center[0] + r_x * math.cos(angle)
-        y = center[1] + r_y * math.sin(angle)
+        x = center[0] + r_x * cos_angle
+        y = center[1] + r_y * sin_angle
         control_points.append((x, y))
 
     return control_points
@@ -103,15 +132,13 @@ def generate_control_points_with_bounds(
     control_points = []
     min_radius = padding + 50
 
-    for i in range(num_points):
-        angle = (2 * math.pi * i) / num_points
-
+    for cos_angle, sin_angle in _unit_circle(num_points):
         # Add random variation and clamp to bounds (not cryptographic use)
         var = random.uniform(-variation, variation)  # noqa: S311  # nosec B311
         r_x = max(min_radius, min(width / 2 - padding, base_radius[0] * (1 + var)))
         r_y = max(min_radius, min(height / 2 - padding, base_radius[1] * (1 + var)))
 
-        control_points.append((center[0] + r_x * math.cos(angle), center[1] + r_y * math.sin(angle)))
+        control_points.append((center[0] + r_x * cos_angle, center[1] + r_y * sin_angle))
 
     return control_points
 
@@ -131,7 +158,7 @@ def _compute_perpendicular_normal(
     """
     dx = next_point[0] - prev_point[0]
     dy = next_point[1] - prev_point[1]
-    length = math.sqrt(dx * dx + dy * dy)
+    length = math.hypot(dx, dy)
 
     if length == 0:
         return None
@@ -144,7 +171,7 @@ def apply_curve_offset(
     index: int,
     offset_dist: float,
     direction: int,
-) -> None:
+) -> tuple[float, float] | None:
     """Apply perpendicular offset to a control point to create curves.
 
     Modifies control points in place to create curves by offsetting
@@ -155,6 +182,9 @@ def apply_curve_offset(
         index: Index of point to offset
         offset_dist: Distance to offset
         direction: Direction multiplier (+1 or -1)
+
+    Returns:
+        Unit normal used for the offset, or None if the neighbors are coincident
     """
     num_points = len(control_points)
     prev_pt = control_points[index - 1]
@@ -167,6 +197,8 @@ def apply_curve_offset(
         current = control_points[index]
         control_points[index] = (current[0] + normal_x, current[1] + normal_y)
 
+    return normal
+
 
 def add_s_curves(control_points: list[tuple[float, float]]) -> None:
     """Add S-curves at multiple locations along the track.
@@ -187,7 +219,7 @@ def add_s_curves(control_points: list[tuple[float, float]]) -> None:
     for idx, i in enumerate(s_curve_positions):
         if 0 < i < num_points:
             offset_dist = 50 if idx % 2 == 0 else 35
-            direction = (-1) ** idx
+            direction = _ALTERNATING_DIRECTIONS[idx & 1]
             apply_curve_offset(control_points, i, offset_dist, direction)
 
 
@@ -207,16 +239,18 @@ def add_chicanes(control_points: list[tuple[float, float]]) -> None:
         if not (1 < i < num_points - 1):
             continue
 
-        direction = (-1) ** idx
-        apply_curve_offset(control_points, i, 30, direction)
-        _adjust_chicane_adjacent_point(control_points, i, direction, num_points)
+        direction = _ALTERNATING_DIRECTIONS[idx & 1]
+        # Only point i moves, so its neighbors' normal still applies to point i + 1
+        normal = apply_curve_offset(control_points, i, 30, direction)
+        if normal:
+            _adjust_chicane_adjacent_point(control_points, i, direction, normal)
 
 
 def _adjust_chicane_adjacent_point(
     control_points: list[tuple[float, float]],
     index: int,
     direction: int,
-    num_points: int,
+    normal: tuple[float, float],
 ) -> None:
     """Adjust adjacent point for chicane effect.
 
@@ -224,16 +258,9 @@ def _adjust_chicane_adjacent_point(
         control_points: Control points to modify
         index: Current chicane index
         direction: Direction multiplier
-        num_points: Total number of points
+        normal: Unit normal already computed for the chicane point
     """
-    if index + 1 >= num_points:
-        return
-
-    prev_pt = control_points[index - 1]
-    next_pt = control_points[(index + 1) % num_points]
-    normal = _compute_perpendicular_normal(prev_pt, next_pt)
-
-    if not normal:
+    if index + 1 >= len(control_points):
         return
 
     chicane_offset = 30
@@ -297,27 +324,24 @@ def _apply_hairpin_offset(
     if not normal:
         return
 
+    # Scale the normal once; entry and exit points move half as far
+    offset_x = normal[0] * hairpin_distance
+    offset_y = normal[1] * hairpin_distance
+    half_x = offset_x * 0.5
+    half_y = offset_y * 0.5
+
     # Offset main point
-    control_points[base_idx] = (
-        base_point[0] + normal[0] * hairpin_distance,
-        base_point[1] + normal[1] * hairpin_distance,
-    )
+    control_points[base_idx] = (base_point[0] + offset_x, base_point[1] + offset_y)
 
     # Offset entry point
     if base_idx - 1 >= 0:
         entry = control_points[base_idx - 1]
-        control_points[base_idx - 1] = (
-            entry[0] + normal[0] * hairpin_distance * 0.5,
-            entry[1] + normal[1] * hairpin_distance * 0.5,
-        )
+        control_points[base_idx - 1] = (entry[0] + half_x, entry[1] + half_y)
 
     # Offset exit point
     if base_idx + 1 < num_points:
         exit_pt = control_points[base_idx + 1]
-        control_points[base_idx + 1] = (
-            exit_pt[0] + normal[0] * hairpin_distance * 0.5,
-            exit_pt[1] + normal[1] * hairpin_distance * 0.5,
-        )
+        control_points[base_idx + 1] = (exit_pt[0] + half_x, exit_pt[1] + half_y)
 
 
 def add_track_variation(
@@ -352,17 +376,48 @@ def generate_procedural_track(
     height: int,
     difficulty: str,
     config: TrackConfig,
+    seed: int | None = None,
 ) -> TrackBoundary:
     """Generate a windy procedural track using radial variation.
 
     Creates a continuous closed-loop track with configurable difficulty
-    and track features.
+    and track features. Seeded tracks are deterministic, so they are
+    served from an LRU cache keyed on the configuration and seed.
 
     Args:
         width: Canvas width
         height: Canvas height
         difficulty: Difficulty level ("easy", "medium", "hard")
         config: Track configuration parameters
+        seed: Optional seed for reproducible generation
+
+    Returns:
+        TrackBoundary with inner and outer boundaries. Seeded results are
+        shared between callers; TrackBoundary is fully immutable, so no
+        caller can alter another's track.
+
+    Raises:
+        ValueError: If track generation produces insufficient points
+    """
+    if seed is None:
+        return _build_procedural_track(width, height, config, _UNSEEDED_RNG)
+    return _generate_seeded_track(width, height, config, seed)
+
+
+@lru_cache(maxsize=128)
+def _generate_seeded_track(width: int, height: int, config: TrackConfig, seed: int) -> TrackBoundary:
+    """Generate and cache a procedural track for a fixed seed."""
+    return _build_procedural_track(width, height, config, random.Random(seed))  # noqa: S311  # nosec B311
+
+
+def _build_procedural_track(width: int, height: int, config: TrackConfig, rng: random.Random) -> TrackBoundary:
+    """Run the procedural pipeline with the given random source.
+
+    Args:
+        width: Canvas width
+        height: Canvas height
+        config: Track configuration parameters
+        rng: Random source for control point variation
 
     Returns:
         TrackBoundary with inner and outer boundaries
@@ -382,22 +437,23 @@ def generate_procedural_track(
         height=height,
         padding=config.padding,
         track_width=config.track_width,
+        rng=rng,
     )
 
-    # Smooth the control points
-    smoothed = smooth_track_centerline(control_points, config.smoothing_passes)
-
-    # Interpolate to dense centerline
-    centerline = interpolate_centerline(smoothed, config.points_per_segment)
-
-    # Generate boundaries
-    outer, inner = generate_track_boundaries(centerline, config.track_width)
+    # Smooth, interpolate and extrude boundaries
+    boundary = build_track_boundary(
+        control_points,
+        config.track_width,
+        smoothing_passes=config.smoothing_passes,
+        points_per_segment=config.points_per_segment,
+    )
 
     # Validate sufficient points
-    if len(outer) < 3 or len(inner) < 3:
-        raise ValueError(f"Track generation failed: insufficient points (outer={len(outer)}, inner={len(inner)})")
+    outer_count, inner_count = len(boundary.outer), len(boundary.inner)
+    if outer_count < 3 or inner_count < 3:
+        raise ValueError(f"Track generation failed: insufficient points (outer={outer_count}, inner={inner_count})")
 
-    return TrackBoundary(outer=outer, inner=inner)
+    return boundary
 
 
 def generate_oval_track(
@@ -422,26 +478,22 @@ def generate_oval_track(
 
     # Generate points around the oval
     num_points = 32
-    outer_points = []
-    inner_points = []
-
-    for i in range(num_points):
-        angle = (2 * math.pi * i) / num_points
-        cos_angle = math.cos(angle)
-        sin_angle = math.sin(angle)
+    outer_coords = []
+    inner_coords = []
 
+    for cos_angle, sin_angle in _unit_circle(num_points):
         # Outer and inner boundaries
-        outer_points.append(
-            Point2D(
-                x=center[0] + outer_radius[0] * cos_angle,
-                y=center[1] + outer_radius[1] * sin_angle,
+        outer_coords.append(
+            (
+                center[0] + outer_radius[0] * cos_angle,
+                center[1] + outer_radius[1] * sin_angle,
             )
         )
-        inner_points.append(
-            Point2D(
-                x=center[0] + inner_radius[0] * cos_angle,
-                y=center[1] + inner_radius[1] * sin_angle,
+        inner_coords.append(
+            (
+                center[0] + inner_radius[0] * cos_angle,
+                center[1] + inner_radius[1] * sin_angle,
             )
         )
 
-    return TrackBoundary(outer=outer_points, inner=inner_points)
+    return TrackBoundary(outer=points_from_coords(outer_coords), inner=points_from_coords(inner_coords))
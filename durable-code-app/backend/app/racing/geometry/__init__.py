@@ -8,6 +8,7 @@ Overview: This package contains all geometric operations needed for track
 
 from .boundaries import (
     TrackBoundary,
+    build_track_boundary,
     calculate_normal_offset,
     generate_boundaries_from_centerline,
     generate_track_boundaries,
@@ -27,6 +28,7 @@ __all__ = [
     "normalize_angle",
     # Boundaries
     "TrackBoundary",
+    "build_track_boundary",
     "calculate_normal_offset",
     "generate_track_boundaries",
     "generate_boundaries_from_centerline",
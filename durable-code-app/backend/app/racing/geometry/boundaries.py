@@ -4,8 +4,8 @@ Purpose: Generate inner and outer track boundaries from centerline
 Scope: Boundary calculation using perpendicular normals
 Overview: This module calculates track boundaries by offsetting the centerline
     using perpendicular normal vectors. Extracted from racing.py for modularity.
-Dependencies: Standard library math, Pydantic models from racing.models
-Exports: generate_track_boundaries, calculate_normal_offset
+Dependencies: Standard library math, Pydantic models from racing.models, curve functions
+Exports: generate_track_boundaries, calculate_normal_offset, build_track_boundary
 Interfaces: Functions for boundary generation from centerline
 Implementation: Normal vector calculation and boundary offset
 """
@@ -13,14 +13,16 @@ Implementation: Normal vector calculation and boundary offset
 import math
 from collections.abc import Callable
 
-from ..models import Point2D, TrackBoundary
+from ..models import Point2D, TrackBoundary, points_from_coords
+from ..types import Centerline, Coordinate
+from .curves import interpolate_centerline, smooth_track_centerline
 
 
 def calculate_normal_offset(
-    current: tuple[float, float],
-    next_point: tuple[float, float],
+    current: Coordinate,
+    next_point: Coordinate,
     track_width: float,
-) -> tuple[float, float]:
+) -> Coordinate:
     """Calculate inner boundary point using normal vector.
 
     Computes the perpendicular normal vector to the tangent and offsets
@@ -37,7 +39,7 @@ def calculate_normal_offset(
     # Calculate tangent vector
     tangent_x = next_point[0] - current[0]
     tangent_y = next_point[1] - current[1]
-    length = math.sqrt(tangent_x**2 + tangent_y**2)
+    length = math.hypot(tangent_x, tangent_y)
 
     if length > 0:
         # Perpendicular vector (rotated 90 degrees)
@@ -56,9 +58,9 @@ def calculate_normal_offset(
 
 
 def generate_track_boundaries(
-    interpolated_centerline: list[tuple[float, float]],
+    interpolated_centerline: Centerline,
     track_width: float,
-) -> tuple[list[Point2D], list[Point2D]]:
+) -> tuple[tuple[Point2D, ...], tuple[Point2D, ...]]:
     """Generate inner and outer track boundaries from centerline.
 
     Takes a densely interpolated centerline and creates parallel inner
@@ -70,52 +72,42 @@ def generate_track_boundaries(
         track_width: Total track width
 
     Returns:
-        Tuple of (outer_points, inner_points) as Point2D lists
+        Tuple of (outer_points, inner_points) as Point2D tuples
     """
-    all_outer_points = []
-    all_inner_points = []
+    outer_coords: Centerline = []
+    inner_coords: Centerline = []
     half_width = track_width / 2
-    num_points = len(interpolated_centerline)
-
-    for i, current in enumerate(interpolated_centerline):
-        next_pt = interpolated_centerline[(i + 1) % num_points]
+    following = interpolated_centerline[1:] + interpolated_centerline[:1]
 
+    for (x, y), (next_x, next_y) in zip(interpolated_centerline, following, strict=True):
         # Calculate tangent direction
-        dx = next_pt[0] - current[0]
-        dy = next_pt[1] - current[1]
-        length = math.sqrt(dx * dx + dy * dy)
+        dx = next_x - x
+        dy = next_y - y
+        length = math.hypot(dx, dy)
 
         if length > 0:
-            # Normal vector (perpendicular to tangent)
-            normal = (-dy / length, dx / length)
-
-            # Offset current point in both directions
-            all_outer_points.append(
-                Point2D(
-                    x=current[0] + normal[0] * half_width,
-                    y=current[1] + normal[1] * half_width,
-                )
-            )
-            all_inner_points.append(
-                Point2D(
-                    x=current[0] - normal[0] * half_width,
-                    y=current[1] - normal[1] * half_width,
-                )
-            )
+            # Normal vector (perpendicular to tangent) scaled to half the track width
+            scale = half_width / length
+            offset_x = -dy * scale
+            offset_y = dx * scale
         else:
             # Degenerate case - offset horizontally
-            all_outer_points.append(Point2D(x=current[0] + half_width, y=current[1]))
-            all_inner_points.append(Point2D(x=current[0] - half_width, y=current[1]))
+            offset_x = half_width
+            offset_y = 0.0
+
+        # Offset current point in both directions
+        outer_coords.append((x + offset_x, y + offset_y))
+        inner_coords.append((x - offset_x, y - offset_y))
 
-    return all_outer_points, all_inner_points
+    return points_from_coords(outer_coords), points_from_coords(inner_coords)
 
 
 def generate_boundaries_from_centerline(
-    control_points: list[tuple[float, float]],
+    control_points: Centerline,
     track_width: float,
     *,
-    interpolate_fn: Callable[[list[tuple[float, float]]], list[tuple[float, float]]],
-    smooth_fn: Callable[[list[tuple[float, float]]], list[tuple[float, float]]],
+    interpolate_fn: Callable[[Centerline], Centerline],
+    smooth_fn: Callable[[Centerline], Centerline],
 ) -> TrackBoundary:
     """Generate track boundaries from centerline control points.
 
@@ -141,3 +133,30 @@ def generate_boundaries_from_centerline(
     outer, inner = generate_track_boundaries(centerline, track_width)
 
     return TrackBoundary(outer=outer, inner=inner)
+
+
+def build_track_boundary(
+    control_points: Centerline,
+    track_width: float,
+    smoothing_passes: int = 2,
+    points_per_segment: int = 10,
+) -> TrackBoundary:
+    """Build a closed track from control points in a single pipeline.
+
+    Smooths the control points, interpolates the dense centerline and
+    extrudes both boundaries, converting to Point2D models only once at
+    the end. This is the shared entry point for every layout generator.
+
+    Args:
+        control_points: Control points defining centerline
+        track_width: Width of track
+        smoothing_passes: Number of smoothing iterations
+        points_per_segment: Number of interpolated points per segment
+
+    Returns:
+        TrackBoundary with inner and outer boundaries
+    """
+    smoothed = smooth_track_centerline(control_points, smoothing_passes)
+    centerline = interpolate_centerline(smoothed, points_per_segment)
+    outer, inner = generate_track_boundaries(centerline, track_width)
+    return TrackBoundary(outer=outer, inner=inner)
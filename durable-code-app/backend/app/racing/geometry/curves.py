@@ -5,26 +5,31 @@ Scope: Centerline interpolation, curve smoothing algorithms
 Overview: This module contains mathematical functions for interpolating smooth
     curves using Catmull-Rom splines and smoothing track centerlines. Extracted
     from the monolithic racing.py to improve modularity.
-Dependencies: Standard library math
+Dependencies: Standard library math and functools, racing.types coordinate aliases
 Exports: catmull_rom_point, smooth_track_centerline, interpolate_centerline
 Interfaces: Pure functions for curve operations
-Implementation: Catmull-Rom spline math and moving average smoothing
+Implementation: Centripetal Catmull-Rom spline math and moving average smoothing
 """
 
 import math
+from functools import lru_cache
+
+from ..types import Centerline, Coordinate
 
 
 def catmull_rom_point(
-    p0: tuple[float, float],
-    p1: tuple[float, float],
-    p2: tuple[float, float],
-    p3: tuple[float, float],
+    p0: Coordinate,
+    p1: Coordinate,
+    p2: Coordinate,
+    p3: Coordinate,
     t: float,
-) -> tuple[float, float]:
-    """Calculate a point on a Catmull-Rom curve.
+) -> Coordinate:
+    """Calculate a point on a centripetal Catmull-Rom curve.
 
     Catmull-Rom splines create smooth curves through control points.
-    This implementation uses the standard Catmull-Rom basis matrix.
+    This implementation uses the centripetal parameterization (alpha = 0.5),
+    which spaces knots by the square root of the chord length so the curve
+    never forms cusps or self-intersections within a segment.
 
     Args:
         p0: First control point (before curve segment)
@@ -36,29 +41,12 @@ def catmull_rom_point(
     Returns:
         Interpolated point (x, y) on the curve
     """
-    t2 = t * t
-    t3 = t2 * t
-
-    # Catmull-Rom basis calculation for x coordinate
-    x = 0.5 * (
-        (2 * p1[0])
-        + (-p0[0] + p2[0]) * t
-        + (2 * p0[0] - 5 * p1[0] + 4 * p2[0] - p3[0]) * t2
-        + (-p0[0] + 3 * p1[0] - 3 * p2[0] + p3[0]) * t3
-    )
-
-    # Catmull-Rom basis calculation for y coordinate
-    y = 0.5 * (
-        (2 * p1[1])
-        + (-p0[1] + p2[1]) * t
-        + (2 * p0[1] - 5 * p1[1] + 4 * p2[1] - p3[1]) * t2
-        + (-p0[1] + 3 * p1[1] - 3 * p2[1] + p3[1]) * t3
-    )
+    intervals = (_knot_interval(p0, p1), _knot_interval(p1, p2), _knot_interval(p2, p3))
+    (ax, bx, cx, dx), (ay, by, cy, dy) = _segment_coefficients(p0, p1, p2, p3, intervals)
+    return (((ax * t + bx) * t + cx) * t + dx, ((ay * t + by) * t + cy) * t + dy)
 
-    return (x, y)
 
-
-def smooth_track_centerline(points: list[tuple[float, float]], smoothing_passes: int = 2) -> list[tuple[float, float]]:
+def smooth_track_centerline(points: Centerline, smoothing_passes: int = 2) -> Centerline:
     """Smooth track centerline using moving average filter.
 
     Applies a 3-point moving average filter multiple times to smooth
@@ -77,32 +65,89 @@ def smooth_track_centerline(points: list[tuple[float, float]], smoothing_passes:
     smoothed = points.copy()
 
     for _ in range(smoothing_passes):
-        new_smoothed = []
-        num_points = len(smoothed)
+        # Rotated views pair each point with its closed-loop neighbors
+        previous = smoothed[-1:] + smoothed[:-1]
+        following = smoothed[1:] + smoothed[:1]
 
-        for i in range(num_points):
-            prev_pt = smoothed[(i - 1) % num_points]
-            curr_pt = smoothed[i]
-            next_pt = smoothed[(i + 1) % num_points]
+        # 3-point moving average
+        smoothed = [
+            ((prev_pt[0] + curr_pt[0] + next_pt[0]) / 3, (prev_pt[1] + curr_pt[1] + next_pt[1]) / 3)
+            for prev_pt, curr_pt, next_pt in zip(previous, smoothed, following, strict=True)
+        ]
 
-            # 3-point moving average
-            avg_x = (prev_pt[0] + curr_pt[0] + next_pt[0]) / 3
-            avg_y = (prev_pt[1] + curr_pt[1] + next_pt[1]) / 3
-            new_smoothed.append((avg_x, avg_y))
+    return smoothed
 
-        smoothed = new_smoothed
 
-    return smoothed
+# Knot intervals below this are treated as uniform to avoid dividing by zero
+_MIN_KNOT_INTERVAL = 1e-4
+
+
+def _knot_interval(start: Coordinate, end: Coordinate) -> float:
+    """Get the centripetal knot spacing, sqrt(|end - start|), between two points."""
+    interval = math.sqrt(math.hypot(end[0] - start[0], end[1] - start[1]))
+    return interval if interval > _MIN_KNOT_INTERVAL else 1.0
+
+
+def _axis_coefficients(
+    values: tuple[float, float, float, float],
+    dt0: float,
+    dt1: float,
+    dt2: float,
+) -> tuple[float, float, float, float]:
+    """Compute cubic coefficients (a, b, c, d) of one segment axis.
+
+    The segment is the cubic Hermite curve from v1 to v2 whose tangents are
+    the non-uniform Catmull-Rom tangents rescaled to t in [0, 1], so it
+    evaluates as ((a * t + b) * t + c) * t + d.
+    """
+    v0, v1, v2, v3 = values
+    m1 = ((v1 - v0) / dt0 - (v2 - v0) / (dt0 + dt1) + (v2 - v1) / dt1) * dt1
+    m2 = ((v2 - v1) / dt1 - (v3 - v1) / (dt1 + dt2) + (v3 - v2) / dt2) * dt1
+    return (2 * (v1 - v2) + m1 + m2, 3 * (v2 - v1) - 2 * m1 - m2, m1, v1)
 
 
-def interpolate_centerline(
-    smoothed_points: list[tuple[float, float]], points_per_segment: int = 10
-) -> list[tuple[float, float]]:
-    """Interpolate centerline points using Catmull-Rom splines.
+def _segment_coefficients(
+    p0: Coordinate,
+    p1: Coordinate,
+    p2: Coordinate,
+    p3: Coordinate,
+    intervals: tuple[float, float, float],
+) -> tuple[tuple[float, float, float, float], tuple[float, float, float, float]]:
+    """Compute x and y cubic coefficients of one centripetal Catmull-Rom segment.
+
+    Args:
+        p0: Point before the segment
+        p1: Segment start
+        p2: Segment end
+        p3: Point after the segment
+        intervals: Knot intervals (p0-p1, p1-p2, p2-p3)
+
+    Returns:
+        Tuple of (x coefficients, y coefficients)
+    """
+    dt0, dt1, dt2 = intervals
+    return (
+        _axis_coefficients((p0[0], p1[0], p2[0], p3[0]), dt0, dt1, dt2),
+        _axis_coefficients((p0[1], p1[1], p2[1], p3[1]), dt0, dt1, dt2),
+    )
+
+
+@lru_cache(maxsize=16)
+def _sample_parameters(points_per_segment: int) -> tuple[float, ...]:
+    """Get the evenly spaced t values in [0, 1) sampled on every segment."""
+    return tuple(t / points_per_segment for t in range(points_per_segment))
+
+
+def interpolate_centerline(smoothed_points: Centerline, points_per_segment: int = 10) -> Centerline:
+    """Interpolate centerline points using centripetal Catmull-Rom splines.
 
     Creates a smooth, interpolated centerline by applying Catmull-Rom
     splines between control points. This densifies the point set for
-    smoother track boundaries.
+    smoother track boundaries. Each segment's polynomial coefficients are
+    computed once and then evaluated for every sample, rather than
+    re-deriving the basis per point. Knot intervals are shared between
+    segments, so they are computed once per call, and the evenly spaced
+    sample parameters are cached per points_per_segment.
 
     Args:
         smoothed_points: Smoothed control points
@@ -111,21 +156,24 @@ def interpolate_centerline(
     Returns:
         Dense interpolated centerline
     """
-    interpolated_centerline = []
-    num_control = len(smoothed_points)
+    interpolated_centerline: Centerline = []
+    samples = _sample_parameters(points_per_segment)
 
-    for i in range(num_control):
-        # Get four control points (wrap around for closed loop)
-        p0 = smoothed_points[(i - 1) % num_control]
-        p1 = smoothed_points[i]
-        p2 = smoothed_points[(i + 1) % num_control]
-        p3 = smoothed_points[(i + 2) % num_control]
+    # Rotated views give each segment its four control points (closed loop)
+    previous = smoothed_points[-1:] + smoothed_points[:-1]
+    following = smoothed_points[1:] + smoothed_points[:1]
+    after_next = following[1:] + following[:1]
+
+    # Each knot interval is shared by three segments, so compute it once per point
+    intervals = [_knot_interval(p, q) for p, q in zip(smoothed_points, following, strict=True)]
+    segment_intervals = zip(intervals[-1:] + intervals[:-1], intervals, intervals[1:] + intervals[:1], strict=True)
+
+    for p0, p1, p2, p3, knots in zip(previous, smoothed_points, following, after_next, segment_intervals, strict=True):
+        (ax, bx, cx, dx), (ay, by, cy, dy) = _segment_coefficients(p0, p1, p2, p3, knots)
 
         # Interpolate points along this segment
-        for t in range(points_per_segment):
-            t_norm = t / points_per_segment
-            point = catmull_rom_point(p0, p1, p2, p3, t_norm)
-            interpolated_centerline.append(point)
+        for t in samples:
+            interpolated_centerline.append((((ax * t + bx) * t + cx) * t + dx, ((ay * t + by) * t + cy) * t + dy))
 
     return interpolated_centerline
 
@@ -133,14 +181,13 @@ def interpolate_centerline(
 def normalize_angle(angle: float) -> float:
     """Normalize angle to [-pi, pi] range.
 
+    Uses the IEEE 754 remainder, which is constant time regardless of how
+    many turns the input spans.
+
     Args:
         angle: Angle in radians
 
     Returns:
         Normalized angle in [-pi, pi]
     """
-    while angle > math.pi:
-        angle -= 2 * math.pi
-    while angle < -math.pi:
-        angle += 2 * math.pi
-    return angle
+    return math.remainder(angle, math.tau)
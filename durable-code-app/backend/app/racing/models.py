@@ -5,14 +5,18 @@ Scope: API data validation and serialization
 Overview: This module contains all Pydantic models used for request validation
     and response serialization in the racing API. Extracted from racing.py.
 Dependencies: Pydantic for validation, types module for constants
-Exports: Point2D, TrackBoundary, SimpleTrack, TrackGenerationParams
+Exports: Point2D, TrackBoundary, TrackBoundaryCompact, SimpleTrack, SimpleTrackCompact,
+    TrackGenerationParams, points_from_coords
 Interfaces: Pydantic BaseModel classes for API contracts
 Implementation: Declarative Pydantic models with validation rules
 """
 
-from pydantic import BaseModel, Field
+from collections.abc import Iterable
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from .types import (
+    COMPACT_COORDINATE_DECIMALS,
     DEFAULT_TRACK_HEIGHT,
     DEFAULT_TRACK_WIDTH,
     MAX_TRACK_HEIGHT,
@@ -25,15 +29,42 @@ from .types import (
 class Point2D(BaseModel):
     """2D point representation for API responses."""
 
+    model_config = ConfigDict(frozen=True)
+
     x: float = Field(..., description="X coordinate")
     y: float = Field(..., description="Y coordinate")
 
 
+_POINT_TUPLE_ADAPTER = TypeAdapter(tuple[Point2D, ...])
+
+
+def points_from_coords(coords: Iterable[tuple[float, float]]) -> tuple[Point2D, ...]:
+    """Build Point2D models from (x, y) pairs in a single validation call.
+
+    Validating the whole list at once stays inside pydantic-core, which is
+    cheaper than constructing (or model_construct-ing) each point separately.
+
+    Args:
+        coords: Iterable of (x, y) coordinate pairs
+
+    Returns:
+        Tuple of Point2D models in the same order
+    """
+    return _POINT_TUPLE_ADAPTER.validate_python([{"x": x, "y": y} for x, y in coords])
+
+
 class TrackBoundary(BaseModel):
-    """Track boundary definition with inner and outer points."""
+    """Track boundary definition with inner and outer points.
 
-    inner: list[Point2D] = Field(..., description="Inner track boundary points")
-    outer: list[Point2D] = Field(..., description="Outer track boundary points")
+    Frozen, with tuple point sequences of frozen Point2D models, so neither
+    the fields nor their contents can change and cached boundaries can be
+    shared safely between responses.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    inner: tuple[Point2D, ...] = Field(..., description="Inner track boundary points")
+    outer: tuple[Point2D, ...] = Field(..., description="Outer track boundary points")
 
 
 class SimpleTrack(BaseModel):
@@ -56,6 +87,71 @@ class SimpleTrack(BaseModel):
     track_width: float = Field(default=80, ge=40, le=120, description="Width of the track surface")
 
 
+class TrackBoundaryCompact(BaseModel):
+    """Track boundaries as flat coordinate arrays.
+
+    Same geometry as TrackBoundary, serialized as one float list per axis
+    instead of one object per point, which keeps responses much smaller.
+    Coordinates are rounded to COMPACT_COORDINATE_DECIMALS places, well below
+    the pixel resolution the canvas renders at.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    outer_xs: list[float] = Field(..., description="Outer boundary X coordinates")
+    outer_ys: list[float] = Field(..., description="Outer boundary Y coordinates")
+    inner_xs: list[float] = Field(..., description="Inner boundary X coordinates")
+    inner_ys: list[float] = Field(..., description="Inner boundary Y coordinates")
+
+    @classmethod
+    def from_boundary(
+        cls, boundary: TrackBoundary, decimals: int = COMPACT_COORDINATE_DECIMALS
+    ) -> "TrackBoundaryCompact":
+        """Split a point-based boundary into rounded per-axis coordinate lists.
+
+        Args:
+            boundary: Track boundary with Point2D lists
+            decimals: Decimal places to keep for each coordinate
+
+        Returns:
+            Compact boundary with the same points in the same order
+        """
+        return cls(
+            outer_xs=[round(p.x, decimals) for p in boundary.outer],
+            outer_ys=[round(p.y, decimals) for p in boundary.outer],
+            inner_xs=[round(p.x, decimals) for p in boundary.inner],
+            inner_ys=[round(p.y, decimals) for p in boundary.inner],
+        )
+
+
+class SimpleTrackCompact(BaseModel):
+    """Simple track data with boundaries in the compact array format."""
+
+    width: int = Field(..., description="Track canvas width")
+    height: int = Field(..., description="Track canvas height")
+    boundaries: TrackBoundaryCompact = Field(..., description="Track boundary coordinates")
+    start_position: Point2D = Field(..., description="Starting position for the car")
+    track_width: float = Field(..., description="Width of the track surface")
+
+    @classmethod
+    def from_track(cls, track: SimpleTrack) -> "SimpleTrackCompact":
+        """Convert a SimpleTrack to the compact response format.
+
+        Args:
+            track: Track with point-based boundaries
+
+        Returns:
+            Equivalent track with per-axis boundary coordinates
+        """
+        return cls(
+            width=track.width,
+            height=track.height,
+            boundaries=TrackBoundaryCompact.from_boundary(track.boundaries),
+            start_position=track.start_position,
+            track_width=track.track_width,
+        )
+
+
 class TrackGenerationParams(BaseModel):
     """Parameters for procedural track generation with validation."""
 
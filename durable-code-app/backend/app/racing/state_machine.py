@@ -6,34 +6,79 @@ Overview: This module provides a robust state machine implementation for managin
     connection lifecycles. It ensures valid state transitions, prevents invalid operations,
     and provides clear error messages. The state machine pattern improves code maintainability
     and testability compared to ad-hoc boolean state management.
-Dependencies: Enum for state definitions, dataclasses for configuration
+Dependencies: IntEnum for state definitions, dataclasses for configuration
 Exports: WebSocketState enum, WebSocketStateMachine class
 Interfaces: State machine with transition validation and state query methods
 Implementation: Finite state machine with explicit transition rules and validation
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
+from types import MappingProxyType
+from typing import ClassVar, Final
 
 
-class WebSocketState(str, Enum):
-    """Valid states for WebSocket connection lifecycle."""
-
-    CONNECTING = "connecting"
-    CONNECTED = "connected"
-    STREAMING = "streaming"
-    PAUSED = "paused"
-    DISCONNECTING = "disconnecting"
-    DISCONNECTED = "disconnected"
+class WebSocketState(IntEnum):
+    """Valid states for WebSocket connection lifecycle.
 
+    Integer-valued so state comparisons and table lookups are plain int
+    operations; use _STATE_NAMES for the human-readable form.
+    """
 
-@dataclass
+    CONNECTING = 0
+    CONNECTED = 1
+    STREAMING = 2
+    PAUSED = 3
+    DISCONNECTING = 4
+    DISCONNECTED = 5
+
+
+# Lowercase state names indexed by state value, used in error messages
+_STATE_NAMES: Final = tuple(state.name.lower() for state in WebSocketState)
+
+
+# Shared by every state machine instance; the read-only proxy and frozensets keep it immutable
+_TRANSITION_RULES: Final[Mapping[WebSocketState, frozenset[WebSocketState]]] = MappingProxyType(
+    {
+        WebSocketState.CONNECTING: frozenset({WebSocketState.CONNECTED, WebSocketState.DISCONNECTED}),
+        WebSocketState.CONNECTED: frozenset(
+            {WebSocketState.STREAMING, WebSocketState.PAUSED, WebSocketState.DISCONNECTING}
+        ),
+        WebSocketState.STREAMING: frozenset({WebSocketState.PAUSED, WebSocketState.DISCONNECTING}),
+        WebSocketState.PAUSED: frozenset({WebSocketState.STREAMING, WebSocketState.DISCONNECTING}),
+        WebSocketState.DISCONNECTING: frozenset({WebSocketState.DISCONNECTED}),
+        WebSocketState.DISCONNECTED: frozenset(),  # Terminal state
+    }
+)
+
+# Full error message for every disallowed (current, target) pair, formatted once at import
+_INVALID_TRANSITION_MESSAGES: Final = MappingProxyType(
+    {
+        (state, target): (
+            f"Invalid transition from {_STATE_NAMES[state]} to {_STATE_NAMES[target]}. "
+            f"Valid transitions: {', '.join(_STATE_NAMES[allowed] for allowed in sorted(targets))}"
+        )
+        for state, targets in _TRANSITION_RULES.items()
+        for target in WebSocketState
+        if target not in targets
+    }
+)
+
+# State groups for the is_connected/is_disconnected predicates, built once at import
+_CONNECTED_STATES: Final = frozenset({WebSocketState.CONNECTED, WebSocketState.STREAMING, WebSocketState.PAUSED})
+_DISCONNECTED_STATES: Final = frozenset({WebSocketState.DISCONNECTING, WebSocketState.DISCONNECTED})
+
+
+@dataclass(slots=True)
 class WebSocketStateMachine:
     """State machine for managing WebSocket connection lifecycle.
 
     This state machine ensures that WebSocket connections follow valid state
     transitions and prevents invalid operations. It improves code maintainability
-    by making state management explicit and testable.
+    by making state management explicit and testable. Change state through
+    transition_to (or the helpers built on it) so the cached allowed
+    transitions stay in sync.
 
     Valid state transitions:
         CONNECTING → CONNECTED, DISCONNECTED
@@ -46,7 +91,7 @@ class WebSocketStateMachine:
     Example:
         >>> sm = WebSocketStateMachine()
         >>> sm.state
-        <WebSocketState.CONNECTING: 'connecting'>
+        <WebSocketState.CONNECTING: 0>
         >>> sm.transition_to(WebSocketState.CONNECTED)
         >>> sm.can_stream()
         True
@@ -56,31 +101,13 @@ class WebSocketStateMachine:
     """
 
     state: WebSocketState = WebSocketState.CONNECTING
-    _transition_rules: dict[WebSocketState, set[WebSocketState]] = field(
-        default_factory=lambda: {
-            WebSocketState.CONNECTING: {
-                WebSocketState.CONNECTED,
-                WebSocketState.DISCONNECTED,
-            },
-            WebSocketState.CONNECTED: {
-                WebSocketState.STREAMING,
-                WebSocketState.PAUSED,
-                WebSocketState.DISCONNECTING,
-            },
-            WebSocketState.STREAMING: {
-                WebSocketState.PAUSED,
-                WebSocketState.DISCONNECTING,
-            },
-            WebSocketState.PAUSED: {
-                WebSocketState.STREAMING,
-                WebSocketState.DISCONNECTING,
-            },
-            WebSocketState.DISCONNECTING: {
-                WebSocketState.DISCONNECTED,
-            },
-            WebSocketState.DISCONNECTED: set(),  # Terminal state
-        }
-    )
+    # Allowed targets from the current state; refreshed on every transition
+    _allowed: frozenset[WebSocketState] = field(init=False, repr=False, compare=False)
+    _transition_rules: ClassVar[Mapping[WebSocketState, frozenset[WebSocketState]]] = _TRANSITION_RULES
+
+    def __post_init__(self) -> None:
+        """Cache the allowed transitions for the initial state."""
+        self._allowed = _TRANSITION_RULES[self.state]
 
     def transition_to(self, new_state: WebSocketState) -> None:
         """Transition to a new state with validation.
@@ -91,13 +118,10 @@ class WebSocketStateMachine:
         Raises:
             ValueError: If the transition is not allowed from the current state
         """
-        if not self.can_transition_to(new_state):
-            valid_transitions = ", ".join(s.value for s in self._transition_rules[self.state])
-            raise ValueError(
-                f"Invalid transition from {self.state.value} to {new_state.value}. "
-                f"Valid transitions: {valid_transitions}"
-            )
+        if new_state not in self._allowed:
+            raise ValueError(_INVALID_TRANSITION_MESSAGES[self.state, new_state])
         self.state = new_state
+        self._allowed = _TRANSITION_RULES[new_state]
 
     def can_transition_to(self, new_state: WebSocketState) -> bool:
         """Check if a transition to the given state is valid.
@@ -108,7 +132,7 @@ class WebSocketStateMachine:
         Returns:
             True if the transition is valid, False otherwise
         """
-        return new_state in self._transition_rules[self.state]
+        return new_state in self._allowed
 
     def is_streaming(self) -> bool:
         """Check if currently in streaming state.
@@ -132,11 +156,7 @@ class WebSocketStateMachine:
         Returns:
             True if connected, False otherwise
         """
-        return self.state in {
-            WebSocketState.CONNECTED,
-            WebSocketState.STREAMING,
-            WebSocketState.PAUSED,
-        }
+        return self.state in _CONNECTED_STATES
 
     def is_disconnected(self) -> bool:
         """Check if in a disconnected state (DISCONNECTING or DISCONNECTED).
@@ -144,10 +164,7 @@ class WebSocketStateMachine:
         Returns:
             True if disconnected, False otherwise
         """
-        return self.state in {
-            WebSocketState.DISCONNECTING,
-            WebSocketState.DISCONNECTED,
-        }
+        return self.state in _DISCONNECTED_STATES
 
     def can_stream(self) -> bool:
         """Check if streaming can be started from current state.
@@ -188,7 +205,7 @@ class WebSocketStateMachine:
         elif self.can_transition_to(WebSocketState.DISCONNECTED):
             self.transition_to(WebSocketState.DISCONNECTED)
         else:
-            raise ValueError(f"Cannot disconnect from state {self.state.value}")
+            raise ValueError(f"Cannot disconnect from state {_STATE_NAMES[self.state]}")
 
     def complete_disconnect(self) -> None:
         """Complete disconnection (transition to DISCONNECTED state).
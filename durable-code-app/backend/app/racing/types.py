@@ -5,22 +5,31 @@ Scope: Point, TrackConfig, and other domain primitives
 Overview: This module defines immutable domain types that replace primitive
     obsession (tuples, magic numbers) with explicit, type-safe constructs.
     Uses dataclasses for clarity and enforces immutability where appropriate.
-Dependencies: Standard library dataclasses
-Exports: Point, TrackConfig domain types
+Dependencies: Standard library dataclasses, typing
+Exports: Point, TrackConfig domain types, Coordinate and Centerline aliases, DIFFICULTY_CONFIGS
 Interfaces: Immutable domain primitives with useful methods
-Implementation: Frozen dataclasses for immutability and type safety
+Implementation: NamedTuple points and frozen dataclass configuration for immutability and type safety
 """
 
 import math
 from dataclasses import dataclass
+from functools import cached_property
+from typing import NamedTuple, TypeAlias
 
+# Raw coordinate containers used by the geometry pipeline. Kept as plain
+# tuples/lists so hot loops avoid per-point object overhead; the alias is
+# the single place to change if the storage layout changes.
+Coordinate: TypeAlias = tuple[float, float]
+Centerline: TypeAlias = list[Coordinate]
 
-@dataclass(frozen=True)
-class Point:
+
+class Point(NamedTuple):
     """2D point with immutable coordinates.
 
     Replaces tuple-based point representation with a strongly-typed,
     immutable point class that provides useful geometric operations.
+    Being a tuple, a Point is also a valid Coordinate for the geometry
+    functions and is cheap to construct and unpack.
     """
 
     x: float
@@ -35,9 +44,24 @@ class Point:
         Returns:
             Distance between this point and other
         """
+        # Points are tuples, so math.dist reads both coordinates without attribute lookups
+        return math.dist(self, other)
+
+    def distance_sq_to(self, other: "Point") -> float:
+        """Calculate squared Euclidean distance to another point.
+
+        Cheaper than distance_to when only comparing distances, e.g.
+        against a squared threshold.
+
+        Args:
+            other: Target point
+
+        Returns:
+            Squared distance between this point and other
+        """
         dx = self.x - other.x
         dy = self.y - other.y
-        return math.sqrt(dx * dx + dy * dy)
+        return dx * dx + dy * dy
 
     def to_tuple(self) -> tuple[float, float]:
         """Convert to tuple representation.
@@ -57,7 +81,7 @@ class Point:
         Returns:
             Point instance
         """
-        return cls(x=point[0], y=point[1])
+        return cls(*point)
 
 
 @dataclass(frozen=True)
@@ -99,7 +123,7 @@ class TrackConfig:
         Returns:
             Center point (width/2, height/2)
         """
-        return Point(x=self.width / 2, y=self.height / 2)
+        return self._center
 
     def get_base_radius(self) -> tuple[float, float]:
         """Get the base radius for track generation.
@@ -107,6 +131,17 @@ class TrackConfig:
         Returns:
             (radius_x, radius_y) tuple accounting for padding
         """
+        return self._base_radius
+
+    # The config is frozen, so derived values are computed once per instance.
+    # cached_property stores into the instance __dict__ directly, bypassing the
+    # frozen __setattr__, and does not take part in eq/hash.
+    @cached_property
+    def _center(self) -> Point:
+        return Point(x=self.width / 2, y=self.height / 2)
+
+    @cached_property
+    def _base_radius(self) -> tuple[float, float]:
         radius_x = (self.width - 2 * self.padding) / 2
         radius_y = (self.height - 2 * self.padding) / 2
         return (radius_x, radius_y)
@@ -120,6 +155,8 @@ MAX_TRACK_HEIGHT = 1080
 DEFAULT_TRACK_WIDTH = 800
 DEFAULT_TRACK_HEIGHT = 600
 DEFAULT_TRACK_PADDING = 60
+# Decimal places kept for compact boundary coordinates; canvas rendering is pixel based
+COMPACT_COORDINATE_DECIMALS = 2
 
 # Difficulty configurations
 DIFFICULTY_PARAMS = {
@@ -128,6 +165,17 @@ DIFFICULTY_PARAMS = {
     "hard": {"track_width": 80.0, "num_points": 20, "variation": 0.28},
 }
 
+# Default TrackConfig per difficulty, built once; requests only replace() overridden fields
+DIFFICULTY_CONFIGS: dict[str, TrackConfig] = {
+    name: TrackConfig(
+        track_width=float(params["track_width"]),
+        num_control_points=int(params["num_points"]),
+        variation_amount=float(params["variation"]),
+        padding=DEFAULT_TRACK_PADDING,
+    )
+    for name, params in DIFFICULTY_PARAMS.items()
+}
+
 # HTTP Status codes
 HTTP_BAD_REQUEST = 400
 HTTP_NOT_FOUND = 404
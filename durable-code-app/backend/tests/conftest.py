@@ -0,0 +1,11 @@
+"""Shared pytest fixtures for backend tests."""
+
+import pytest
+
+from .helpers import FakeClock
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Provide a fake clock so timeout tests do not sleep."""
+    return FakeClock()
@@ -0,0 +1,17 @@
+"""Shared test helpers for backend tests."""
+
+
+class FakeClock:
+    """Manually advanced monotonic clock for time-dependent components."""
+
+    def __init__(self) -> None:
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current fake time in seconds."""
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward without waiting."""
+        self.now += seconds
@@ -8,15 +8,21 @@ Overview: Comprehensive test suite for racing API routes including
 Dependencies: pytest, FastAPI TestClient
 Exports: Test functions for pytest
 Interfaces: pytest test suite
-Implementation: Unit tests with mocking and fixtures
+Implementation: Unit tests sharing one session-scoped TestClient, with
+    parametrized cases for values that differ only by one field
 """
 
+from collections.abc import Iterator
+from typing import Any
+
 import pytest
 from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
 
 from app.main import app
 from app.racing.models import SimpleTrack, TrackBoundary
 from app.racing.types import (
+    COMPACT_COORDINATE_DECIMALS,
     DEFAULT_TRACK_HEIGHT,
     DEFAULT_TRACK_WIDTH,
     MAX_TRACK_HEIGHT,
@@ -25,14 +31,23 @@ from app.racing.types import (
     MIN_TRACK_WIDTH,
 )
 
-# Create test client
-client = TestClient(app)
+GENERATE_URL = "/api/racing/track/generate"
+
+# Built once so schema checks reuse the compiled validator
+_SIMPLE_TRACK_ADAPTER = TypeAdapter(SimpleTrack)
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """Provide one TestClient whose app lifespan runs once for the session."""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 class TestHealthEndpoint:
     """Tests for the health check endpoint."""
 
-    def test_health_check_returns_healthy_status(self) -> None:
+    def test_health_check_returns_healthy_status(self, client: TestClient) -> None:
         """Test that health check returns healthy status."""
         response = client.get("/api/racing/health")
         assert response.status_code == 200
@@ -44,7 +59,7 @@ class TestHealthEndpoint:
 class TestSimpleTrackEndpoint:
     """Tests for the simple track generation endpoint."""
 
-    def test_get_simple_track_with_defaults(self) -> None:
+    def test_get_simple_track_with_defaults(self, client: TestClient) -> None:
         """Test simple track generation with default parameters."""
         response = client.get("/api/racing/track/simple")
         assert response.status_code == 200
@@ -62,7 +77,7 @@ class TestSimpleTrackEndpoint:
         assert data["height"] == DEFAULT_TRACK_HEIGHT
         assert data["track_width"] == 100
 
-    def test_get_simple_track_with_custom_dimensions(self) -> None:
+    def test_get_simple_track_with_custom_dimensions(self, client: TestClient) -> None:
         """Test simple track generation with custom width and height."""
         custom_width = 1000
         custom_height = 800
@@ -74,35 +89,21 @@ class TestSimpleTrackEndpoint:
         assert data["width"] == custom_width
         assert data["height"] == custom_height
 
-    def test_get_simple_track_validates_min_width(self) -> None:
-        """Test that width below minimum is rejected."""
-        invalid_width = MIN_TRACK_WIDTH - 1
-
-        response = client.get(f"/api/racing/track/simple?width={invalid_width}")
-        assert response.status_code == 422  # Validation error
-
-    def test_get_simple_track_validates_max_width(self) -> None:
-        """Test that width above maximum is rejected."""
-        invalid_width = MAX_TRACK_WIDTH + 1
-
-        response = client.get(f"/api/racing/track/simple?width={invalid_width}")
+    @pytest.mark.parametrize(
+        ("field", "invalid_value"),
+        [
+            ("width", MIN_TRACK_WIDTH - 1),
+            ("width", MAX_TRACK_WIDTH + 1),
+            ("height", MIN_TRACK_HEIGHT - 1),
+            ("height", MAX_TRACK_HEIGHT + 1),
+        ],
+    )
+    def test_get_simple_track_validates_dimensions(self, client: TestClient, field: str, invalid_value: int) -> None:
+        """Test that dimensions outside the allowed range are rejected."""
+        response = client.get(f"/api/racing/track/simple?{field}={invalid_value}")
         assert response.status_code == 422  # Validation error
 
-    def test_get_simple_track_validates_min_height(self) -> None:
-        """Test that height below minimum is rejected."""
-        invalid_height = MIN_TRACK_HEIGHT - 1
-
-        response = client.get(f"/api/racing/track/simple?height={invalid_height}")
-        assert response.status_code == 422  # Validation error
-
-    def test_get_simple_track_validates_max_height(self) -> None:
-        """Test that height above maximum is rejected."""
-        invalid_height = MAX_TRACK_HEIGHT + 1
-
-        response = client.get(f"/api/racing/track/simple?height={invalid_height}")
-        assert response.status_code == 422  # Validation error
-
-    def test_get_simple_track_has_valid_boundaries(self) -> None:
+    def test_get_simple_track_has_valid_boundaries(self, client: TestClient) -> None:
         """Test that generated track has valid boundary points."""
         response = client.get("/api/racing/track/simple")
         assert response.status_code == 200
@@ -121,7 +122,7 @@ class TestSimpleTrackEndpoint:
             assert isinstance(point["x"], (int, float))
             assert isinstance(point["y"], (int, float))
 
-    def test_get_simple_track_has_valid_start_position(self) -> None:
+    def test_get_simple_track_has_valid_start_position(self, client: TestClient) -> None:
         """Test that generated track has valid start position."""
         response = client.get("/api/racing/track/simple")
         assert response.status_code == 200
@@ -137,9 +138,9 @@ class TestSimpleTrackEndpoint:
 class TestGenerateTrackEndpoint:
     """Tests for the procedural track generation endpoint."""
 
-    def test_generate_track_with_default_params(self) -> None:
+    def test_generate_track_with_default_params(self, client: TestClient) -> None:
         """Test track generation with default parameters."""
-        response = client.post("/api/racing/track/generate", json={})
+        response = client.post(GENERATE_URL, json={})
         assert response.status_code == 200
         data = response.json()
 
@@ -149,173 +150,132 @@ class TestGenerateTrackEndpoint:
         assert "start_position" in data
         assert "track_width" in data
 
-    def test_generate_track_with_easy_difficulty(self) -> None:
-        """Test track generation with easy difficulty."""
-        response = client.post("/api/racing/track/generate", json={"difficulty": "easy"})
-        assert response.status_code == 200
-        data = response.json()
-
-        # Easy difficulty should have wider track
-        assert data["track_width"] == 120.0
-
-    def test_generate_track_with_medium_difficulty(self) -> None:
-        """Test track generation with medium difficulty."""
-        response = client.post("/api/racing/track/generate", json={"difficulty": "medium"})
-        assert response.status_code == 200
-        data = response.json()
-
-        assert data["track_width"] == 100.0
-
-    def test_generate_track_with_hard_difficulty(self) -> None:
-        """Test track generation with hard difficulty."""
-        response = client.post("/api/racing/track/generate", json={"difficulty": "hard"})
+    @pytest.mark.parametrize(
+        ("difficulty", "expected_track_width"),
+        [("easy", 120.0), ("medium", 100.0), ("hard", 80.0)],
+    )
+    def test_generate_track_difficulty_sets_track_width(
+        self, client: TestClient, difficulty: str, expected_track_width: float
+    ) -> None:
+        """Test easier difficulties produce wider tracks."""
+        response = client.post(GENERATE_URL, json={"difficulty": difficulty})
         assert response.status_code == 200
-        data = response.json()
-
-        # Hard difficulty should have narrower track
-        assert data["track_width"] == 80.0
-
-    def test_generate_track_validates_difficulty(self) -> None:
-        """Test that invalid difficulty is rejected."""
-        response = client.post("/api/racing/track/generate", json={"difficulty": "invalid"})
-        assert response.status_code == 422  # Validation error
-
-    def test_generate_track_with_seed(self) -> None:
-        """Test track generation with seed parameter."""
-        seed = 42
-        response = client.post("/api/racing/track/generate", json={"seed": seed})
-        assert response.status_code == 200
-
-    def test_generate_track_validates_seed_range(self) -> None:
-        """Test that seed outside valid range is rejected."""
-        invalid_seed = 1000000  # Above max of 999999
-        response = client.post("/api/racing/track/generate", json={"seed": invalid_seed})
-        assert response.status_code == 422  # Validation error
+        assert response.json()["track_width"] == expected_track_width
 
-    def test_generate_track_with_custom_dimensions(self) -> None:
+    def test_generate_track_with_custom_dimensions(self, client: TestClient) -> None:
         """Test track generation with custom width and height."""
         custom_width = 1200
         custom_height = 900
 
-        response = client.post(
-            "/api/racing/track/generate", json={"width": custom_width, "height": custom_height}
-        )
+        response = client.post(GENERATE_URL, json={"width": custom_width, "height": custom_height})
         assert response.status_code == 200
         data = response.json()
 
         assert data["width"] == custom_width
         assert data["height"] == custom_height
 
-    def test_generate_track_with_figure8_layout(self) -> None:
-        """Test track generation with figure-8 layout."""
-        response = client.post("/api/racing/track/generate", json={"layout": "figure8"})
+    @pytest.mark.parametrize("layout", ["figure8", "spa", "monaco", "laguna", "suzuka"])
+    def test_generate_track_layout(self, client: TestClient, layout: str) -> None:
+        """Test track generation for each named layout."""
+        response = client.post(GENERATE_URL, json={"layout": layout})
         assert response.status_code == 200
         data = response.json()
 
-        assert "boundaries" in data
         assert len(data["boundaries"]["inner"]) > 0
         assert len(data["boundaries"]["outer"]) > 0
 
-    def test_generate_track_with_spa_layout(self) -> None:
-        """Test track generation with Spa-inspired layout."""
-        response = client.post("/api/racing/track/generate", json={"layout": "spa"})
-        assert response.status_code == 200
-
-    def test_generate_track_with_monaco_layout(self) -> None:
-        """Test track generation with Monaco-style layout."""
-        response = client.post("/api/racing/track/generate", json={"layout": "monaco"})
-        assert response.status_code == 200
-
-    def test_generate_track_with_laguna_layout(self) -> None:
-        """Test track generation with Laguna Seca layout."""
-        response = client.post("/api/racing/track/generate", json={"layout": "laguna"})
-        assert response.status_code == 200
-
-    def test_generate_track_with_suzuka_layout(self) -> None:
-        """Test track generation with Suzuka-style layout."""
-        response = client.post("/api/racing/track/generate", json={"layout": "suzuka"})
+    def test_repeated_layout_requests_return_same_track(self, client: TestClient) -> None:
+        """Test cached named layouts return identical tracks for identical requests."""
+        payload = {"layout": "monaco", "width": 1024, "height": 768}
+        first = client.post(GENERATE_URL, json=payload)
+        second = client.post(GENERATE_URL, json=payload)
+
+        assert first.status_code == 200
+        assert first.json() == second.json()
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"seed": 42},
+            {"num_points": 12},
+            {"variation_amount": 0.3},
+            {"hairpin_chance": 0.5, "hairpin_intensity": 3.0},
+            {"smoothing_passes": 3},
+        ],
+    )
+    def test_generate_track_accepts_optional_params(self, client: TestClient, payload: dict[str, Any]) -> None:
+        """Test track generation with individual optional parameters."""
+        response = client.post(GENERATE_URL, json=payload)
         assert response.status_code == 200
 
-    def test_generate_track_validates_layout(self) -> None:
-        """Test that invalid layout is rejected."""
-        response = client.post("/api/racing/track/generate", json={"layout": "invalid"})
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"difficulty": "invalid"},
+            {"seed": 1000000},  # Above max of 999999
+            {"layout": "invalid"},
+            {"num_points": 5},
+            {"num_points": 25},
+            {"variation_amount": 0.01},
+            {"variation_amount": 0.6},
+            {"smoothing_passes": 6},
+            {"track_width_override": 50.0},
+            {"track_width_override": 150.0},
+        ],
+    )
+    def test_generate_track_rejects_invalid_params(self, client: TestClient, payload: dict[str, Any]) -> None:
+        """Test that out-of-range or unknown parameter values are rejected."""
+        response = client.post(GENERATE_URL, json=payload)
         assert response.status_code == 422  # Validation error
 
-    def test_generate_track_with_custom_num_points(self) -> None:
-        """Test track generation with custom number of control points."""
-        response = client.post("/api/racing/track/generate", json={"num_points": 12})
-        assert response.status_code == 200
-
-    def test_generate_track_validates_num_points_min(self) -> None:
-        """Test that num_points below minimum is rejected."""
-        response = client.post("/api/racing/track/generate", json={"num_points": 5})
-        assert response.status_code == 422  # Validation error
-
-    def test_generate_track_validates_num_points_max(self) -> None:
-        """Test that num_points above maximum is rejected."""
-        response = client.post("/api/racing/track/generate", json={"num_points": 25})
-        assert response.status_code == 422  # Validation error
-
-    def test_generate_track_with_custom_variation(self) -> None:
-        """Test track generation with custom variation amount."""
-        response = client.post("/api/racing/track/generate", json={"variation_amount": 0.3})
+    def test_generate_track_with_track_width_override(self, client: TestClient) -> None:
+        """Test track generation with custom track width."""
+        response = client.post(GENERATE_URL, json={"track_width_override": 90.0})
         assert response.status_code == 200
+        data = response.json()
 
-    def test_generate_track_validates_variation_min(self) -> None:
-        """Test that variation_amount below minimum is rejected."""
-        response = client.post("/api/racing/track/generate", json={"variation_amount": 0.01})
-        assert response.status_code == 422  # Validation error
-
-    def test_generate_track_validates_variation_max(self) -> None:
-        """Test that variation_amount above maximum is rejected."""
-        response = client.post("/api/racing/track/generate", json={"variation_amount": 0.6})
-        assert response.status_code == 422  # Validation error
-
-    def test_generate_track_with_hairpin_params(self) -> None:
-        """Test track generation with hairpin parameters."""
-        response = client.post(
-            "/api/racing/track/generate", json={"hairpin_chance": 0.5, "hairpin_intensity": 3.0}
-        )
-        assert response.status_code == 200
+        assert data["track_width"] == 90.0
 
-    def test_generate_track_with_smoothing_passes(self) -> None:
-        """Test track generation with custom smoothing passes."""
-        response = client.post("/api/racing/track/generate", json={"smoothing_passes": 3})
-        assert response.status_code == 200
 
-    def test_generate_track_validates_smoothing_max(self) -> None:
-        """Test that smoothing_passes above maximum is rejected."""
-        response = client.post("/api/racing/track/generate", json={"smoothing_passes": 6})
-        assert response.status_code == 422  # Validation error
+class TestGenerateCompactTrackEndpoint:
+    """Tests for POST /api/racing/track/generate/compact endpoint."""
 
-    def test_generate_track_with_track_width_override(self) -> None:
-        """Test track generation with custom track width."""
-        response = client.post("/api/racing/track/generate", json={"track_width_override": 90.0})
+    def test_compact_track_has_coordinate_arrays(self, client: TestClient) -> None:
+        """Test compact response carries one float list per boundary axis."""
+        response = client.post("/api/racing/track/generate/compact", json={"seed": 42})
         assert response.status_code == 200
-        data = response.json()
+        boundaries = response.json()["boundaries"]
+        assert set(boundaries) == {"outer_xs", "outer_ys", "inner_xs", "inner_ys"}
+        assert len(boundaries["outer_xs"]) == len(boundaries["outer_ys"])
+        assert len(boundaries["inner_xs"]) == len(boundaries["inner_ys"])
 
-        assert data["track_width"] == 90.0
+    def test_compact_track_matches_point_format(self, client: TestClient) -> None:
+        """Test compact response encodes the same track as the point format."""
+        payload = {"difficulty": "hard", "seed": 4242}
+        points = client.post(GENERATE_URL, json=payload).json()
+        compact = client.post("/api/racing/track/generate/compact", json=payload).json()
 
-    def test_generate_track_validates_track_width_min(self) -> None:
-        """Test that track_width_override below minimum is rejected."""
-        response = client.post("/api/racing/track/generate", json={"track_width_override": 50.0})
-        assert response.status_code == 422  # Validation error
+        outer_xs = [round(p["x"], COMPACT_COORDINATE_DECIMALS) for p in points["boundaries"]["outer"]]
+        inner_ys = [round(p["y"], COMPACT_COORDINATE_DECIMALS) for p in points["boundaries"]["inner"]]
+        assert compact["boundaries"]["outer_xs"] == outer_xs
+        assert compact["boundaries"]["inner_ys"] == inner_ys
+        assert compact["start_position"] == points["start_position"]
 
-    def test_generate_track_validates_track_width_max(self) -> None:
-        """Test that track_width_override above maximum is rejected."""
-        response = client.post("/api/racing/track/generate", json={"track_width_override": 150.0})
-        assert response.status_code == 422  # Validation error
+    def test_compact_track_validates_params(self, client: TestClient) -> None:
+        """Test compact endpoint applies the same parameter validation."""
+        response = client.post("/api/racing/track/generate/compact", json={"difficulty": "invalid"})
+        assert response.status_code == 422
 
 
 class TestErrorHandling:
     """Tests for error handling in API routes."""
 
-    def test_simple_track_handles_extreme_dimensions(self) -> None:
+    def test_simple_track_handles_extreme_dimensions(self, client: TestClient) -> None:
         """Test that extreme but valid dimensions are handled gracefully."""
         response = client.get(f"/api/racing/track/simple?width={MIN_TRACK_WIDTH}&height={MIN_TRACK_HEIGHT}")
         assert response.status_code == 200
 
-    def test_generate_track_handles_all_parameters_at_once(self) -> None:
+    def test_generate_track_handles_all_parameters_at_once(self, client: TestClient) -> None:
         """Test track generation with all optional parameters specified."""
         params = {
             "difficulty": "hard",
@@ -330,38 +290,36 @@ class TestErrorHandling:
             "smoothing_passes": 3,
             "track_width_override": 90.0,
         }
-        response = client.post("/api/racing/track/generate", json=params)
+        response = client.post(GENERATE_URL, json=params)
         assert response.status_code == 200
 
 
 class TestResponseStructure:
     """Tests for response structure and data integrity."""
 
-    def test_simple_track_response_matches_schema(self) -> None:
+    def test_simple_track_response_matches_schema(self, client: TestClient) -> None:
         """Test that simple track response matches SimpleTrack schema."""
         response = client.get("/api/racing/track/simple")
         assert response.status_code == 200
-        data = response.json()
 
-        # Validate response can be deserialized to SimpleTrack
-        track = SimpleTrack(**data)
+        # Validate the raw response body against the SimpleTrack schema
+        track = _SIMPLE_TRACK_ADAPTER.validate_json(response.content)
         assert track is not None
         assert isinstance(track.boundaries, TrackBoundary)
 
-    def test_generated_track_response_matches_schema(self) -> None:
+    def test_generated_track_response_matches_schema(self, client: TestClient) -> None:
         """Test that generated track response matches SimpleTrack schema."""
-        response = client.post("/api/racing/track/generate", json={"difficulty": "medium"})
+        response = client.post(GENERATE_URL, json={"difficulty": "medium"})
         assert response.status_code == 200
-        data = response.json()
 
-        # Validate response can be deserialized to SimpleTrack
-        track = SimpleTrack(**data)
+        # Validate the raw response body against the SimpleTrack schema
+        track = _SIMPLE_TRACK_ADAPTER.validate_json(response.content)
         assert track is not None
         assert isinstance(track.boundaries, TrackBoundary)
 
-    def test_track_boundaries_form_closed_loop(self) -> None:
+    def test_track_boundaries_form_closed_loop(self, client: TestClient) -> None:
         """Test that track boundaries have sufficient points to form a closed loop."""
-        response = client.post("/api/racing/track/generate", json={})
+        response = client.post(GENERATE_URL, json={})
         assert response.status_code == 200
         data = response.json()
 
@@ -369,7 +327,7 @@ class TestResponseStructure:
         assert len(data["boundaries"]["inner"]) >= 3
         assert len(data["boundaries"]["outer"]) >= 3
 
-    def test_start_position_within_track_bounds(self) -> None:
+    def test_start_position_within_track_bounds(self, client: TestClient) -> None:
         """Test that start position is within the track canvas bounds."""
         width = 800
         height = 600
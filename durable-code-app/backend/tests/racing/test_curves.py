@@ -47,6 +47,16 @@ class TestCatmullRomPoint:
         assert 0.0 < result[0] < 10.0
         assert result[1] >= 9.0  # Should stay close to y=10
 
+    def test_catmull_rom_tight_segment_does_not_overshoot(self) -> None:
+        """Test short segments between distant neighbors stay between their endpoints."""
+        p0 = (0.0, 0.0)
+        p1 = (10.0, 0.0)
+        p2 = (10.5, 0.1)
+        p3 = (0.0, 0.2)
+
+        xs = [catmull_rom_point(p0, p1, p2, p3, t / 10)[0] for t in range(11)]
+        assert all(p1[0] <= x <= p2[0] for x in xs)
+
 
 class TestSmoothTrackCenterline:
     """Tests for track centerline smoothing."""
@@ -2,7 +2,7 @@
 
 import pytest
 
-from app.racing.types import DIFFICULTY_PARAMS, Point, TrackConfig
+from app.racing.types import DIFFICULTY_CONFIGS, DIFFICULTY_PARAMS, Point, TrackConfig
 
 
 class TestPoint:
@@ -15,7 +15,7 @@ class TestPoint:
         assert point.y == 20.0
 
     def test_point_immutability(self) -> None:
-        """Test Point is immutable (frozen dataclass)."""
+        """Test Point is immutable."""
         point = Point(x=10.0, y=20.0)
         with pytest.raises(AttributeError):
             point.x = 30.0  # type: ignore
@@ -27,6 +27,12 @@ class TestPoint:
         distance = p1.distance_to(p2)
         assert distance == 5.0  # 3-4-5 triangle
 
+    def test_distance_sq_to(self) -> None:
+        """Test squared distance calculation between points."""
+        p1 = Point(x=0.0, y=0.0)
+        p2 = Point(x=3.0, y=4.0)
+        assert p1.distance_sq_to(p2) == 25.0
+
     def test_to_tuple(self) -> None:
         """Test conversion to tuple."""
         point = Point(x=10.0, y=20.0)
@@ -71,6 +77,14 @@ class TestTrackConfig:
         assert radius_x == (800 - 2 * 60) / 2
         assert radius_y == (600 - 2 * 60) / 2
 
+    def test_derived_values_are_cached_without_affecting_equality(self) -> None:
+        """Test center and radius are computed once and ignored by eq/hash."""
+        config = TrackConfig(width=800, height=600)
+        assert config.get_center() is config.get_center()
+        assert config.get_base_radius() is config.get_base_radius()
+        assert config == TrackConfig(width=800, height=600)
+        assert hash(config) == hash(TrackConfig(width=800, height=600))
+
     def test_config_immutability(self) -> None:
         """Test TrackConfig is immutable."""
         config = TrackConfig()
@@ -97,6 +111,15 @@ class TestConstants:
             assert isinstance(params["num_points"], int)
             assert isinstance(params["variation"], float)
 
+    def test_difficulty_configs_match_params(self) -> None:
+        """Test prebuilt difficulty configs mirror DIFFICULTY_PARAMS."""
+        assert DIFFICULTY_CONFIGS.keys() == DIFFICULTY_PARAMS.keys()
+        for difficulty, params in DIFFICULTY_PARAMS.items():
+            config = DIFFICULTY_CONFIGS[difficulty]
+            assert config.track_width == params["track_width"]
+            assert config.num_control_points == params["num_points"]
+            assert config.variation_amount == params["variation"]
+
     def test_difficulty_progression(self) -> None:
         """Test difficulty parameters increase in difficulty."""
         easy = DIFFICULTY_PARAMS["easy"]
@@ -1,11 +1,16 @@
 """Security tests for ReDoS protection, WebSocket rate limiting, and error sanitization."""
 
 import time
+from unittest.mock import AsyncMock
 
 import pytest
+from fastapi import Request
 
+from app.main import handle_general_exception
 from app.security import PATH_PATTERN, validate_path
 
+from .helpers import FakeClock
+
 
 def test_redos_protection_malicious_input() -> None:
     """Test ReDoS protection with malicious input that would cause backtracking.
@@ -106,7 +111,7 @@ def test_websocket_rate_limiter_allows_within_limits() -> None:
     """Test WebSocket rate limiter allows connections within limits."""
     from app.oscilloscope import WebSocketRateLimiter
 
-    limiter = WebSocketRateLimiter(max_connections_per_ip=5, window_seconds=60.0)
+    limiter = WebSocketRateLimiter(max_connections_per_window=5, window_seconds=60.0)
 
     # Should allow up to 5 connections from same IP
     for i in range(5):
@@ -118,7 +123,7 @@ def test_websocket_rate_limiter_blocks_exceeding_limits() -> None:
     """Test WebSocket rate limiter blocks connections exceeding limits."""
     from app.oscilloscope import WebSocketRateLimiter
 
-    limiter = WebSocketRateLimiter(max_connections_per_ip=5, window_seconds=60.0)
+    limiter = WebSocketRateLimiter(max_connections_per_window=5, window_seconds=60.0)
 
     # Allow 5 connections
     for _ in range(5):
@@ -133,7 +138,7 @@ def test_websocket_rate_limiter_per_ip_isolation() -> None:
     """Test WebSocket rate limiter isolates different IPs."""
     from app.oscilloscope import WebSocketRateLimiter
 
-    limiter = WebSocketRateLimiter(max_connections_per_ip=5, window_seconds=60.0)
+    limiter = WebSocketRateLimiter(max_connections_per_window=5, window_seconds=60.0)
 
     # Max out connections for first IP
     for _ in range(5):
@@ -144,12 +149,12 @@ def test_websocket_rate_limiter_per_ip_isolation() -> None:
     assert result is True, "Different IP should not be affected"
 
 
-def test_websocket_rate_limiter_window_expiration() -> None:
+def test_websocket_rate_limiter_window_expiration(clock: FakeClock) -> None:
     """Test WebSocket rate limiter window expiration."""
     from app.oscilloscope import WebSocketRateLimiter
 
     # Use short window for testing
-    limiter = WebSocketRateLimiter(max_connections_per_ip=2, window_seconds=0.1)
+    limiter = WebSocketRateLimiter(max_connections_per_window=2, window_seconds=0.1, clock=clock)
 
     # Use up connections
     limiter.check_rate_limit("192.168.1.100")
@@ -158,95 +163,89 @@ def test_websocket_rate_limiter_window_expiration() -> None:
     # Should be blocked
     assert limiter.check_rate_limit("192.168.1.100") is False
 
-    # Wait for window to expire
-    time.sleep(0.15)
+    # Let the window expire
+    clock.advance(0.15)
 
     # Should be allowed again
     result = limiter.check_rate_limit("192.168.1.100")
     assert result is True, "Should allow connections after window expiration"
 
 
-def test_websocket_rate_limiter_release_connection() -> None:
-    """Test WebSocket rate limiter connection release."""
+def test_websocket_rate_limiter_refills_over_time(clock: FakeClock) -> None:
+    """Test WebSocket rate limiter refills tokens gradually and never refunds on close."""
     from app.oscilloscope import WebSocketRateLimiter
 
-    limiter = WebSocketRateLimiter(max_connections_per_ip=2, window_seconds=60.0)
+    # Two connections per 60s window refill one token every 30s
+    limiter = WebSocketRateLimiter(max_connections_per_window=2, window_seconds=60.0, clock=clock)
 
     # Use up connections
-    limiter.check_rate_limit("192.168.1.100")
-    limiter.check_rate_limit("192.168.1.100")
-
-    # Should be blocked
+    assert limiter.check_rate_limit("192.168.1.100") is True
+    assert limiter.check_rate_limit("192.168.1.100") is True
     assert limiter.check_rate_limit("192.168.1.100") is False
 
-    # Release one connection
-    limiter.release_connection("192.168.1.100")
+    # Half a refill interval is not enough for another connection
+    clock.advance(15.0)
+    assert limiter.check_rate_limit("192.168.1.100") is False
 
-    # Should be able to connect again
-    result = limiter.check_rate_limit("192.168.1.100")
-    assert result is True, "Should allow connection after release"
+    # Completing the interval earns exactly one token
+    clock.advance(15.0)
+    assert limiter.check_rate_limit("192.168.1.100") is True
+    assert limiter.check_rate_limit("192.168.1.100") is False
 
+    # A long idle period refills only up to the burst size
+    clock.advance(600.0)
+    assert limiter.check_rate_limit("192.168.1.100") is True
+    assert limiter.check_rate_limit("192.168.1.100") is True
+    assert limiter.check_rate_limit("192.168.1.100") is False
 
-@pytest.mark.asyncio
-async def test_error_sanitization_production() -> None:
-    """Test that error messages are sanitized in production environment."""
-    import os
-    from unittest.mock import AsyncMock, patch
 
-    from fastapi import Request
+@pytest.fixture
+def mock_request() -> AsyncMock:
+    """Provide a mocked request for exception handler tests."""
+    request = AsyncMock(spec=Request)
+    request.url.path = "/test"
+    request.method = "GET"
+    return request
 
-    from app.main import handle_general_exception
 
-    # Mock request
-    mock_request = AsyncMock(spec=Request)
-    mock_request.url.path = "/test"
-    mock_request.method = "GET"
+@pytest.mark.asyncio
+async def test_error_sanitization_production(mock_request: AsyncMock, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that error messages are sanitized in production environment."""
+    # Simulate production environment; monkeypatch restores only this key afterwards
+    monkeypatch.setenv("ENVIRONMENT", "production")
 
-    # Simulate production environment
-    with patch.dict(os.environ, {"ENVIRONMENT": "production"}):
-        test_exception = Exception("Sensitive internal error with database credentials")
-        response = await handle_general_exception(mock_request, test_exception)
+    test_exception = Exception("Sensitive internal error with database credentials")
+    response = await handle_general_exception(mock_request, test_exception)
 
-        # Check response content
-        assert response.status_code == 500
-        # Handle both bytes and memoryview types from response body
-        body = response.body
-        content = body.decode() if isinstance(body, bytes) else bytes(body).decode()
+    # Check response content
+    assert response.status_code == 500
+    # Handle both bytes and memoryview types from response body
+    body = response.body
+    content = body.decode() if isinstance(body, bytes) else bytes(body).decode()
 
-        # Should NOT contain sensitive information
-        assert "database credentials" not in content.lower()
-        assert "sensitive internal error" not in content.lower()
+    # Should NOT contain sensitive information
+    assert "database credentials" not in content.lower()
+    assert "sensitive internal error" not in content.lower()
 
-        # Should contain generic message
-        assert "internal error occurred" in content.lower()
+    # Should contain generic message
+    assert "internal error occurred" in content.lower()
 
 
 @pytest.mark.asyncio
-async def test_error_details_in_development() -> None:
+async def test_error_details_in_development(mock_request: AsyncMock, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that error details are available in development environment."""
-    import os
-    from unittest.mock import AsyncMock, patch
-
-    from fastapi import Request
+    # Simulate development environment
+    monkeypatch.setenv("ENVIRONMENT", "development")
 
-    from app.main import handle_general_exception
+    test_exception = ValueError("Detailed error for debugging")
+    response = await handle_general_exception(mock_request, test_exception)
 
-    # Mock request
-    mock_request = AsyncMock(spec=Request)
-    mock_request.url.path = "/test"
-    mock_request.method = "GET"
+    # Check response content
+    assert response.status_code == 500
+    # Handle both bytes and memoryview types from response body
+    body = response.body
+    content = body.decode() if isinstance(body, bytes) else bytes(body).decode()
 
-    # Simulate development environment
-    with patch.dict(os.environ, {"ENVIRONMENT": "development"}):
-        test_exception = ValueError("Detailed error for debugging")
-        response = await handle_general_exception(mock_request, test_exception)
-
-        # Check response content
-        assert response.status_code == 500
-        # Handle both bytes and memoryview types from response body
-        body = response.body
-        content = body.decode() if isinstance(body, bytes) else bytes(body).decode()
-
-        # Should contain detailed error information
-        assert "Detailed error for debugging" in content
-        assert "ValueError" in content
+    # Should contain detailed error information
+    assert "Detailed error for debugging" in content
+    assert "ValueError" in content
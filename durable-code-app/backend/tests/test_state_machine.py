@@ -4,6 +4,21 @@ import pytest
 
 from app.racing.state_machine import WebSocketState, WebSocketStateMachine
 
+# (initial state, target state, whether the transition is allowed)
+TRANSITION_CASES = [
+    (WebSocketState.CONNECTING, WebSocketState.CONNECTED, True),
+    (WebSocketState.CONNECTING, WebSocketState.DISCONNECTED, True),
+    (WebSocketState.CONNECTING, WebSocketState.STREAMING, False),
+    (WebSocketState.CONNECTED, WebSocketState.STREAMING, True),
+    (WebSocketState.CONNECTED, WebSocketState.PAUSED, True),
+    (WebSocketState.CONNECTED, WebSocketState.CONNECTING, False),
+    (WebSocketState.STREAMING, WebSocketState.PAUSED, True),
+    (WebSocketState.STREAMING, WebSocketState.DISCONNECTING, True),
+    (WebSocketState.PAUSED, WebSocketState.STREAMING, True),
+    (WebSocketState.DISCONNECTING, WebSocketState.DISCONNECTED, True),
+    (WebSocketState.DISCONNECTED, WebSocketState.CONNECTING, False),
+]
+
 
 class TestWebSocketStateMachine:
     """Tests for WebSocketStateMachine class."""
@@ -18,74 +33,23 @@ class TestWebSocketStateMachine:
         sm = WebSocketStateMachine(state=WebSocketState.CONNECTED)
         assert sm.state == WebSocketState.CONNECTED
 
-    def test_valid_transition_from_connecting_to_connected(self) -> None:
-        """Test valid transition from CONNECTING to CONNECTED."""
-        sm = WebSocketStateMachine()
-        sm.transition_to(WebSocketState.CONNECTED)
-        assert sm.state == WebSocketState.CONNECTED
-
-    def test_valid_transition_from_connecting_to_disconnected(self) -> None:
-        """Test valid transition from CONNECTING to DISCONNECTED."""
-        sm = WebSocketStateMachine()
-        sm.transition_to(WebSocketState.DISCONNECTED)
-        assert sm.state == WebSocketState.DISCONNECTED
-
-    def test_invalid_transition_from_connecting_to_streaming(self) -> None:
-        """Test invalid transition from CONNECTING to STREAMING."""
-        sm = WebSocketStateMachine()
-        with pytest.raises(ValueError, match="Invalid transition"):
-            sm.transition_to(WebSocketState.STREAMING)
-
-    def test_valid_transition_from_connected_to_streaming(self) -> None:
-        """Test valid transition from CONNECTED to STREAMING."""
-        sm = WebSocketStateMachine(state=WebSocketState.CONNECTED)
-        sm.transition_to(WebSocketState.STREAMING)
-        assert sm.state == WebSocketState.STREAMING
-
-    def test_valid_transition_from_connected_to_paused(self) -> None:
-        """Test valid transition from CONNECTED to PAUSED."""
-        sm = WebSocketStateMachine(state=WebSocketState.CONNECTED)
-        sm.transition_to(WebSocketState.PAUSED)
-        assert sm.state == WebSocketState.PAUSED
-
-    def test_valid_transition_from_streaming_to_paused(self) -> None:
-        """Test valid transition from STREAMING to PAUSED."""
-        sm = WebSocketStateMachine(state=WebSocketState.CONNECTED)
-        sm.start_streaming()
-        sm.pause_streaming()
-        assert sm.state == WebSocketState.PAUSED
-
-    def test_valid_transition_from_paused_to_streaming(self) -> None:
-        """Test valid transition from PAUSED to STREAMING."""
-        sm = WebSocketStateMachine(state=WebSocketState.CONNECTED)
-        sm.transition_to(WebSocketState.PAUSED)
-        sm.start_streaming()
-        assert sm.state == WebSocketState.STREAMING
-
-    def test_valid_transition_to_disconnecting(self) -> None:
-        """Test valid transition to DISCONNECTING."""
-        sm = WebSocketStateMachine(state=WebSocketState.STREAMING)
-        sm.transition_to(WebSocketState.DISCONNECTING)
-        assert sm.state == WebSocketState.DISCONNECTING
-
-    def test_valid_transition_to_disconnected(self) -> None:
-        """Test valid transition to DISCONNECTED."""
-        sm = WebSocketStateMachine(state=WebSocketState.DISCONNECTING)
-        sm.transition_to(WebSocketState.DISCONNECTED)
-        assert sm.state == WebSocketState.DISCONNECTED
-
-    def test_no_transitions_from_disconnected(self) -> None:
-        """Test that no transitions are allowed from DISCONNECTED state."""
-        sm = WebSocketStateMachine(state=WebSocketState.DISCONNECTED)
-        with pytest.raises(ValueError, match="Invalid transition"):
-            sm.transition_to(WebSocketState.CONNECTING)
-
-    def test_can_transition_to_checks_valid_transitions(self) -> None:
-        """Test can_transition_to method."""
-        sm = WebSocketStateMachine(state=WebSocketState.CONNECTED)
-        assert sm.can_transition_to(WebSocketState.STREAMING)
-        assert sm.can_transition_to(WebSocketState.PAUSED)
-        assert not sm.can_transition_to(WebSocketState.CONNECTING)
+    @pytest.mark.parametrize(("initial", "target", "valid"), TRANSITION_CASES)
+    def test_transition_to(self, initial: WebSocketState, target: WebSocketState, valid: bool) -> None:
+        """Test transition_to applies valid transitions and rejects invalid ones."""
+        sm = WebSocketStateMachine(state=initial)
+        if valid:
+            sm.transition_to(target)
+            assert sm.state == target
+        else:
+            with pytest.raises(ValueError, match="Invalid transition"):
+                sm.transition_to(target)
+            assert sm.state == initial
+
+    @pytest.mark.parametrize(("initial", "target", "valid"), TRANSITION_CASES)
+    def test_can_transition_to(self, initial: WebSocketState, target: WebSocketState, valid: bool) -> None:
+        """Test can_transition_to agrees with transition_to."""
+        sm = WebSocketStateMachine(state=initial)
+        assert sm.can_transition_to(target) is valid
 
     def test_is_streaming_returns_true_when_streaming(self) -> None:
         """Test is_streaming returns True when in STREAMING state."""
@@ -245,3 +209,20 @@ class TestWebSocketStateMachine:
 
         # Verify DISCONNECTED has no outgoing transitions (terminal state)
         assert len(sm._transition_rules[WebSocketState.DISCONNECTED]) == 0
+
+    def test_equality_and_repr_only_consider_state(self) -> None:
+        """Test that equality and repr ignore the shared transition table."""
+        sm = WebSocketStateMachine(state=WebSocketState.CONNECTED)
+        other = WebSocketStateMachine()
+        other.transition_to(WebSocketState.CONNECTED)
+
+        assert sm == other
+        assert sm != WebSocketStateMachine(state=WebSocketState.STREAMING)
+        assert repr(sm) == "WebSocketStateMachine(state=<WebSocketState.CONNECTED: 1>)"
+
+    def test_transition_rules_are_read_only(self) -> None:
+        """Test that the shared transition table cannot be modified."""
+        with pytest.raises(TypeError):
+            WebSocketStateMachine._transition_rules[WebSocketState.DISCONNECTED] = frozenset(  # type: ignore[index]
+                {WebSocketState.CONNECTING}
+            )
@@ -13,7 +13,8 @@ Overview: Provides functions to resolve profile names to file paths, load and va
     the justfile uses bash-native YAML parsing for host-side operation without a Python
     dependency.
 
-Dependencies: PyYAML for YAML parsing, pathlib for file resolution, sys for CLI entry point
+Dependencies: PyYAML for YAML parsing (libyaml C loader when available), pathlib for file resolution, functools for caching,
+    sys for CLI entry point
 
 Exports: resolve_profile_path, load_profile, profile_to_locust_args, profile_to_env_vars
 
@@ -21,18 +22,34 @@ Interfaces: CLI via python -m lib.profile_loader <profile_name> outputs KEY=VALU
     programmatic via imported functions returning lists and dicts
 
 Implementation: Simple flat YAML schema with required field validation. Profile resolution
-    searches the profiles/ directory relative to the load-testing package root.
+    searches the profiles/ directory relative to the load-testing package root. Resolved
+    paths and parsed profiles are memoized; parsed profiles are keyed on file mtime so
+    edits are picked up.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
+# libyaml's C parser when PyYAML was built with it; same safe schema either way
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 PROFILES_DIR = Path(__file__).resolve().parent.parent / "profiles"
 REQUIRED_FIELDS = ("users", "spawn_rate", "duration")
 
 
+@lru_cache(maxsize=1)
+def _available_profiles() -> tuple[str, ...]:
+    """List profile names present in the profiles directory."""
+    return tuple(sorted(p.stem for p in PROFILES_DIR.glob("*.yml")))
+
+
+@lru_cache(maxsize=32)
 def resolve_profile_path(name: str) -> Path:
     """Map a profile name to its YAML file path.
 
@@ -40,7 +57,7 @@ def resolve_profile_path(name: str) -> Path:
     """
     profile_path = PROFILES_DIR / f"{name}.yml"
     if not profile_path.is_file():
-        available = sorted(p.stem for p in PROFILES_DIR.glob("*.yml"))
+        available = _available_profiles()
         available_str = ", ".join(available) if available else "(none found)"
         msg = (
             f"Profile '{name}' not found at {profile_path}. "
@@ -50,13 +67,11 @@ def resolve_profile_path(name: str) -> Path:
     return profile_path
 
 
-def load_profile(path: Path) -> dict:
-    """Read and validate a YAML profile file.
-
-    Raises ValueError if required fields are missing.
-    """
+@lru_cache(maxsize=32)
+def _parse_profile(path: Path, mtime_ns: int) -> dict:
+    """Parse and validate a profile file; mtime_ns is part of the cache key only."""
     with open(path, encoding="utf-8") as fh:
-        profile: dict = yaml.safe_load(fh)
+        profile: dict = yaml.load(fh, Loader=_SafeLoader)  # nosec B506 - CSafeLoader/SafeLoader
 
     missing = [f for f in REQUIRED_FIELDS if f not in profile]
     if missing:
@@ -66,6 +81,15 @@ def load_profile(path: Path) -> dict:
     return profile
 
 
+def load_profile(path: Path) -> dict:
+    """Read and validate a YAML profile file.
+
+    Raises ValueError if required fields are missing. Parsed profiles are
+    cached until the file changes; callers receive their own copy.
+    """
+    return dict(_parse_profile(path, path.stat().st_mtime_ns))
+
+
 def profile_to_locust_args(profile: dict) -> list[str]:
     """Convert profile settings to Locust CLI argument list."""
     return [
@@ -100,8 +124,6 @@ if __name__ == "__main__":
         sys.exit(1)
 
     args = profile_to_locust_args(profile_data)
-    env = profile_to_env_vars(profile_data)
-
-    print(f"LOCUST_ARGS={' '.join(args)}")
-    for key, val in env.items():
-        print(f"{key}={val}")
+    lines = [f"LOCUST_ARGS={' '.join(args)}"]
+    lines.extend(f"{key}={val}" for key, val in profile_to_env_vars(profile_data).items())
+    sys.stdout.write("\n".join(lines) + "\n")
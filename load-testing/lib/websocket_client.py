@@ -10,22 +10,25 @@ Overview: Provides a LocustWebSocketClient class that wraps the websockets sync
     utility function for converting HTTP host URLs to WebSocket URLs. Uses the websockets sync
     API, which relies on standard Python sockets compatible with gevent monkey-patching.
 
-Dependencies: websockets (sync client), Locust (environment events for metric reporting), json
+Dependencies: websockets (sync client), Locust (environment events for metric reporting), orjson
 
-Exports: LocustWebSocketClient class, http_to_ws_url utility function
+Exports: LocustWebSocketClient class, http_to_ws_url and encode_json utility functions
 
-Interfaces: connect(url, name), send_json(data, name), receive_json(name, timeout),
-    close(name), is_connected property
+Interfaces: connect(url, name), send_json(data, name), send_text(payload, name),
+    receive_json(name, timeout), receive_batch(count, name, timeout), drain(name), close(name),
+    is_connected property
 
 Implementation: Each method catches specific exceptions (ConnectionClosed, TimeoutError,
-    OSError, json.JSONDecodeError) and reports them as Locust failures without re-raising.
+    OSError, orjson.JSONDecodeError) and reports them as Locust failures without re-raising.
     The calling User class checks is_connected or return values to decide whether to continue.
+    Compression is negotiated only when WS_COMPRESSION=on, keeping deflate CPU off the workers.
 """
 
-import json
+import os
 import time
 from urllib.parse import urlparse, urlunparse
 
+import orjson
 from websockets.exceptions import ConnectionClosed, InvalidStatus
 from websockets.sync.client import ClientConnection, connect
 
@@ -33,15 +36,38 @@ from locust import events
 
 DEFAULT_OPEN_TIMEOUT = 10
 DEFAULT_RECV_TIMEOUT = 5
+# drain() treats the socket as idle once no message arrives for this long
+DRAIN_QUIET_SECONDS = 0.05
+# ...and gives up if messages keep arriving for this long (the stream never stopped)
+DRAIN_MAX_SECONDS = 1.0
+# Oscilloscope frames carry 100 samples (a few KB); cap well below the 1 MiB library default
+MAX_MESSAGE_SIZE = 64 * 1024
+# permessage-deflate costs CPU on every frame; off by default, WS_COMPRESSION=on to A/B it
+WS_COMPRESSION = "deflate" if os.environ.get("WS_COMPRESSION", "off") == "on" else None
 WS_REQUEST_TYPE = "WebSocket"
 
+# Bound once: locust.events is a process-wide singleton created at import
+_fire_request = events.request.fire
+
+
+# (HTTP prefix, WebSocket prefix) pairs handled without URL parsing
+_WS_SCHEME_PREFIXES = (("https://", "wss://"), ("http://", "ws://"))
+
 
 def http_to_ws_url(http_url: str, ws_path: str) -> str:
     """Convert an HTTP/HTTPS URL to a WebSocket URL with the given path.
 
     Swaps http:// to ws:// and https:// to wss://, then appends the
-    specified path.
+    specified path. Plain scheme://host[:port] URLs, the usual Locust host
+    form, take a string-prefix fast path; anything else is parsed.
     """
+    for http_prefix, ws_prefix in _WS_SCHEME_PREFIXES:
+        if http_url.startswith(http_prefix):
+            authority = http_url[len(http_prefix) :].rstrip("/")
+            if not any(sep in authority for sep in "/?#;"):
+                return ws_prefix + authority + ws_path
+            break
+
     parsed = urlparse(http_url)
     scheme_map = {"http": "ws", "https": "wss"}
     ws_scheme = scheme_map.get(parsed.scheme, "ws")
@@ -49,6 +75,15 @@ def http_to_ws_url(http_url: str, ws_path: str) -> str:
     return urlunparse(ws_parsed)
 
 
+def encode_json(data: dict) -> str:
+    """Serialize data to a JSON string for sending as a WebSocket text frame.
+
+    Decoded to str so the frame goes out as text; the backend reads commands
+    with receive_text.
+    """
+    return orjson.dumps(data).decode()
+
+
 class LocustWebSocketClient:
     """WebSocket client that reports timing metrics to the Locust event system.
 
@@ -71,12 +106,15 @@ class LocustWebSocketClient:
         """
         start = time.perf_counter()
         try:
-            self._ws = connect(url, open_timeout=DEFAULT_OPEN_TIMEOUT)
-            elapsed_ms = (time.perf_counter() - start) * 1000
-            self._fire_event(name, elapsed_ms, 0)
+            self._ws = connect(
+                url,
+                open_timeout=DEFAULT_OPEN_TIMEOUT,
+                max_size=MAX_MESSAGE_SIZE,
+                compression=WS_COMPRESSION,
+            )
+            self._report(name, start, 0)
         except (OSError, TimeoutError, InvalidStatus) as exc:
-            elapsed_ms = (time.perf_counter() - start) * 1000
-            self._fire_event(name, elapsed_ms, 0, exc)
+            self._report(name, start, 0, exc)
             self._ws = None
             return False
         return True
@@ -86,20 +124,27 @@ class LocustWebSocketClient:
     ) -> bool:
         """Serialize data as JSON and send over the WebSocket.
 
+        Returns True on success, False on failure.
+        """
+        return self.send_text(encode_json(data), name)
+
+    def send_text(self, payload: str, name: str = "ws send") -> bool:
+        """Send an already-encoded JSON text frame over the WebSocket.
+
+        Lets callers encode fixed commands once with encode_json and resend
+        them without serializing on every cycle.
+
         Returns True on success, False on failure.
         """
         start = time.perf_counter()
         try:
-            payload = json.dumps(data)
             if self._ws is None:
                 msg = "WebSocket not connected"
                 raise OSError(msg)
             self._ws.send(payload)
-            elapsed_ms = (time.perf_counter() - start) * 1000
-            self._fire_event(name, elapsed_ms, len(payload))
+            self._report(name, start, len(payload))
         except (ConnectionClosed, OSError) as exc:
-            elapsed_ms = (time.perf_counter() - start) * 1000
-            self._fire_event(name, elapsed_ms, 0, exc)
+            self._report(name, start, 0, exc)
             self._ws = None
             return False
         return True
@@ -119,21 +164,86 @@ class LocustWebSocketClient:
                 msg = "WebSocket not connected"
                 raise OSError(msg)
             raw = self._ws.recv(timeout=timeout)
-            data: dict = json.loads(raw)
-            elapsed_ms = (time.perf_counter() - start) * 1000
+            data: dict = orjson.loads(raw)
             response_length = len(raw) if isinstance(raw, (str, bytes)) else 0
-            self._fire_event(name, elapsed_ms, response_length)
+            self._report(name, start, response_length)
         except (ConnectionClosed, TimeoutError, OSError) as exc:
-            elapsed_ms = (time.perf_counter() - start) * 1000
-            self._fire_event(name, elapsed_ms, 0, exc)
+            self._report(name, start, 0, exc)
             self._ws = None
             return None
-        except json.JSONDecodeError as exc:
-            elapsed_ms = (time.perf_counter() - start) * 1000
-            self._fire_event(name, elapsed_ms, 0, exc)
+        except orjson.JSONDecodeError as exc:
+            self._report(name, start, 0, exc)
             return None
         return data
 
+    def receive_batch(
+        self,
+        count: int,
+        name: str = "ws receive",
+        timeout: float = DEFAULT_RECV_TIMEOUT,
+    ) -> list[dict] | None:
+        """Receive count JSON messages, reporting one Locust event per message.
+
+        Reads run back to back in one loop, and each message is timed from the
+        end of the previous read, matching repeated receive_json calls. The
+        timeout is one deadline for the whole batch, not per message.
+
+        Returns the parsed dicts on success, None on failure.
+        """
+        deadline = time.perf_counter() + timeout
+        messages: list[dict] = []
+        start = time.perf_counter()
+        try:
+            if self._ws is None:
+                msg = "WebSocket not connected"
+                raise OSError(msg)
+            for _ in range(count):
+                raw = self._ws.recv(timeout=max(0.0, deadline - start))
+                messages.append(orjson.loads(raw))
+                self._report(name, start, len(raw))
+                start = time.perf_counter()
+        except (ConnectionClosed, TimeoutError, OSError) as exc:
+            self._report(name, start, 0, exc)
+            self._ws = None
+            return None
+        except orjson.JSONDecodeError as exc:
+            self._report(name, start, 0, exc)
+            return None
+        return messages
+
+    def drain(
+        self,
+        quiet_timeout: float = DRAIN_QUIET_SECONDS,
+        max_duration: float = DRAIN_MAX_SECONDS,
+        name: str = "ws drain",
+    ) -> bool:
+        """Discard messages already pending on the connection.
+
+        Reads until no message arrives within quiet_timeout, so a following
+        receive only sees messages sent after the caller's next command. A
+        successful drain is not reported; failures are reported to Locust.
+
+        Returns True once the connection is idle, False if it failed or
+        messages were still arriving after max_duration.
+        """
+        start = time.perf_counter()
+        deadline = start + max_duration
+        try:
+            if self._ws is None:
+                msg = "WebSocket not connected"
+                raise OSError(msg)
+            while time.perf_counter() < deadline:
+                self._ws.recv(timeout=quiet_timeout)
+        except TimeoutError:
+            return True
+        except (ConnectionClosed, OSError) as exc:
+            self._report(name, start, 0, exc)
+            self._ws = None
+            return False
+        msg = f"Messages still arriving after {max_duration}s; the stream did not stop"
+        self._report(name, start, 0, RuntimeError(msg))
+        return False
+
     def close(self, name: str = "ws disconnect") -> None:
         """Close the WebSocket connection and report timing to Locust."""
         if self._ws is None:
@@ -141,34 +251,27 @@ class LocustWebSocketClient:
         start = time.perf_counter()
         try:
             self._ws.close()
-            elapsed_ms = (time.perf_counter() - start) * 1000
-            self._fire_event(name, elapsed_ms, 0)
+            self._report(name, start, 0)
         except (ConnectionClosed, OSError) as exc:
-            elapsed_ms = (time.perf_counter() - start) * 1000
-            self._fire_event(name, elapsed_ms, 0, exc)
+            self._report(name, start, 0, exc)
         finally:
             self._ws = None
 
-    def _fire_event(
+    def _report(
         self,
         name: str,
-        response_time: float,
+        start: float,
         response_length: int,
         exception: BaseException | None = None,
     ) -> None:
-        """Report a request event to the Locust event system."""
-        if exception is not None:
-            events.request.fire(
-                request_type=WS_REQUEST_TYPE,
-                name=name,
-                response_time=response_time,
-                response_length=response_length,
-                exception=exception,
-            )
-        else:
-            events.request.fire(
-                request_type=WS_REQUEST_TYPE,
-                name=name,
-                response_time=response_time,
-                response_length=response_length,
-            )
+        """Measure time since start once and report the outcome to Locust.
+
+        Locust treats exception=None as success, so both outcomes share one call.
+        """
+        _fire_request(
+            request_type=WS_REQUEST_TYPE,
+            name=name,
+            response_time=(time.perf_counter() - start) * 1000,
+            response_length=response_length,
+            exception=exception,
+        )
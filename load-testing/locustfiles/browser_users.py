@@ -26,7 +26,8 @@ Implementation: Each PlaywrightUser subclass uses the @pw decorator for browser
     management and the event() context manager for per-step metric reporting. Selectors use
     text-based and semantic patterns (not CSS module class names) for stability across builds.
     Uses wait_until="domcontentloaded" for SPA page loads to prevent stalling on streaming
-    resources
+    resources. Steps wait on the UI state they produce rather than fixed delays; only the
+    streaming and racing dwells are timed
 """
 
 import os
@@ -38,6 +39,15 @@ FRONTEND_HOST = os.environ.get(
     "LOAD_TEST_FRONTEND_HOST", "http://host.docker.internal:5173"
 )
 
+# Selectors shared by several journeys
+ROOT_SELECTOR = "#root"
+DEMO_TAB_SELECTOR = 'button:has-text("Demo")'
+LOAD_TIMEOUT_MS = 10000
+
+# Fixed dwells that model a user watching the stream / racing; not readiness waits
+STREAMING_DWELL_MS = 2000
+RACING_DWELL_MS = 3000
+
 TAB_NAMES = [
     "Repository",
     "Planning",
@@ -65,36 +75,39 @@ class OscilloscopePlaywrightUser(PlaywrightUser):
         """Execute one full oscilloscope browser journey."""
         async with event(self, "page_load"):
             await page.goto("/", wait_until="domcontentloaded")
-            await page.wait_for_selector("#root", timeout=10000)
+            await page.wait_for_selector(ROOT_SELECTOR, timeout=LOAD_TIMEOUT_MS)
 
         async with event(self, "navigate_to_demo"):
-            await page.click('button:has-text("Demo")')
-            await page.wait_for_timeout(500)
-
-        async with event(self, "open_oscilloscope"):
+            await page.click(DEMO_TAB_SELECTOR)
             oscilloscope_link = page.get_by_role(
                 "heading", name="Oscilloscope"
             )
+            await oscilloscope_link.wait_for()
+
+        async with event(self, "open_oscilloscope"):
             await oscilloscope_link.click()
-            await page.wait_for_timeout(1000)
+            start_btn = page.get_by_role("button", name="Start")
+            await start_btn.wait_for()
 
         async with event(self, "wait_for_connection"):
             await page.wait_for_selector(
-                'text=Connected', timeout=10000
+                'text=Connected', timeout=LOAD_TIMEOUT_MS
             )
 
         async with event(self, "click_start"):
-            start_btn = page.get_by_role("button", name="Start")
             await start_btn.click()
-            await page.wait_for_timeout(500)
+            await page.wait_for_selector("text=● Active")
 
         async with event(self, "change_waveform"):
             square_btn = page.get_by_text("Square Wave")
             await square_btn.click()
-            await page.wait_for_timeout(500)
+            await page.wait_for_selector(
+                'button[aria-pressed="true"]:has-text("Square Wave")'
+            )
 
         async with event(self, "wait_for_streaming"):
-            await page.wait_for_timeout(2000)
+            # Deliberate dwell: the streamed frames are the load under test
+            await page.wait_for_timeout(STREAMING_DWELL_MS)
 
         async with event(self, "click_stop"):
             stop_btn = page.get_by_role("button", name="Stop")
@@ -117,29 +130,31 @@ class RacingPlaywrightUser(PlaywrightUser):
         """Execute one full racing game browser journey."""
         async with event(self, "page_load"):
             await page.goto("/", wait_until="domcontentloaded")
-            await page.wait_for_selector("#root", timeout=10000)
+            await page.wait_for_selector(ROOT_SELECTOR, timeout=LOAD_TIMEOUT_MS)
 
         async with event(self, "navigate_to_demo"):
-            await page.click('button:has-text("Demo")')
-            await page.wait_for_timeout(500)
-
-        async with event(self, "open_racing_game"):
+            await page.click(DEMO_TAB_SELECTOR)
             racing_link = page.get_by_role(
                 "heading", name="Racing Game"
             )
+            await racing_link.wait_for()
+
+        async with event(self, "open_racing_game"):
             await racing_link.click()
-            await page.wait_for_timeout(500)
 
         async with event(self, "wait_for_track_load"):
-            await page.wait_for_selector("canvas", timeout=10000)
-            await page.wait_for_timeout(1000)
+            await page.wait_for_selector("canvas", timeout=LOAD_TIMEOUT_MS)
+            # The start button reads "Loading Track..." and stays disabled until the track arrives
+            await page.wait_for_selector(
+                'button:has-text("Start Racing"):enabled', timeout=LOAD_TIMEOUT_MS
+            )
 
         async with event(self, "click_start_racing"):
             start_btn = page.get_by_role(
                 "button", name="Start Racing"
             )
             await start_btn.click()
-            await page.wait_for_timeout(500)
+            await page.wait_for_selector('button:has-text("Pause Game")')
 
         async with event(self, "canvas_mouse_interaction"):
             canvas = page.locator("canvas").first
@@ -150,14 +165,16 @@ class RacingPlaywrightUser(PlaywrightUser):
                 await page.mouse.move(center_x, center_y)
                 await page.mouse.move(center_x + 50, center_y + 30)
                 await page.mouse.move(center_x - 30, center_y + 50)
-            await page.wait_for_timeout(3000)
+            # Deliberate dwell: keep the race running as sustained gameplay load
+            await page.wait_for_timeout(RACING_DWELL_MS)
 
 
 class TabNavigationPlaywrightUser(PlaywrightUser):
     """Measures SPA navigation performance by clicking through all application tabs.
 
     Flow: navigate to frontend, loop through all tabs clicking each one and
-    waiting for content render. Each tab click is reported as a separate Locust event.
+    waiting until it is selected and its lazily loaded content has rendered. Each
+    tab click is reported as a separate Locust event.
     """
 
     host = FRONTEND_HOST
@@ -169,9 +186,20 @@ class TabNavigationPlaywrightUser(PlaywrightUser):
         """Navigate through all application tabs measuring load times."""
         async with event(self, "page_load"):
             await page.goto("/", wait_until="domcontentloaded")
-            await page.wait_for_selector("#root", timeout=10000)
+            await page.wait_for_selector(ROOT_SELECTOR, timeout=LOAD_TIMEOUT_MS)
+
+        # Build every tab locator once; they resolve lazily against the live page
+        tab_locators = {
+            tab_name: page.get_by_role("tab", name=tab_name)
+            for tab_name in TAB_NAMES
+        }
+        tab_spinner = page.get_by_role("status", name="Loading...")
 
-        for tab_name in TAB_NAMES:
+        for tab_name, tab in tab_locators.items():
             async with event(self, f"tab_{tab_name.lower().replace(' ', '_')}"):
-                await page.click(f'button:has-text("{tab_name}")')
-                await page.wait_for_timeout(500)
+                await tab.click()
+                await page.get_by_role(
+                    "tab", name=tab_name, selected=True
+                ).wait_for()
+                # Lazily loaded tabs show the Suspense spinner until their chunk renders
+                await tab_spinner.wait_for(state="hidden")
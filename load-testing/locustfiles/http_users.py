@@ -1,16 +1,17 @@
 """
 Purpose: HTTP load test scenarios exercising all backend REST endpoints
 
-Scope: Locust HttpUser definition targeting the Durable Code backend API
+Scope: Locust FastHttpUser definition targeting the Durable Code backend API
 
 Overview: Defines a BackendHttpUser class that exercises all HTTP REST endpoints exposed by the
     FastAPI backend. Tasks are weighted to simulate realistic traffic patterns, with health checks
     and read-heavy endpoints receiving higher weights. Delay endpoints generate distributed traces
     with configurable chaining depth. Locust natively reports non-2xx responses as failures. The
     host defaults to LOCUST_HOST environment variable, enabling flexible targeting of local
-    development, staging, or production instances.
+    development, staging, or production instances. FastHttpUser's geventhttpclient backend
+    keeps a persistent connection per user with far less per-request overhead than requests.
 
-Dependencies: Locust framework (HttpUser, task, between), random (SystemRandom)
+Dependencies: Locust framework (FastHttpUser, task, between), random (SystemRandom, Random)
 
 Exports: BackendHttpUser class for use by Locust master/worker processes
 
@@ -18,18 +19,26 @@ Interfaces: All backend REST endpoints: /, /health, /api/racing/*, /api/oscillos
     /api/delay/*
 
 Implementation: Weighted task distribution reflecting realistic usage patterns with Locust
-    native response status validation
+    native response status validation. Delay endpoint URLs are pre-built from a pool of call
+    chains drawn at import, so each delay task only picks one
 """
 
 import random
 
-from locust import HttpUser, between, task
+from locust import FastHttpUser, between, task
 
 # Cryptographically secure RNG for load test randomization (avoids Bandit S311)
 _secure_random = random.SystemRandom()
 
 _DELAY_TYPES = ["slow", "med", "fast"]
 
+# Track generation posts an empty JSON object; serialize it once rather than per request
+_EMPTY_JSON_BODY = b"{}"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Number of pre-drawn call chains sampled by the delay tasks
+_CHAIN_POOL_SIZE = 1024
+
 
 def _random_call_chain() -> str:
     """Build a random ?call= query string for delay endpoint chaining.
@@ -40,15 +49,26 @@ def _random_call_chain() -> str:
     """
     if _secure_random.random() < 0.4:
         return ""
-    count = _secure_random.randint(1, 3)
-    targets = [_secure_random.choice(_DELAY_TYPES) for _ in range(count)]
+    targets = _secure_random.choices(_DELAY_TYPES, k=_secure_random.randint(1, 3))
     return f"?call={','.join(targets)}"
 
 
-class BackendHttpUser(HttpUser):
+# Chains are drawn once with the secure RNG; per task only a pool index is picked,
+# so a plain Mersenne Twister (no urandom syscall) is enough for that choice
+_CHAIN_POOL = tuple(_random_call_chain() for _ in range(_CHAIN_POOL_SIZE))
+_pool_random = random.Random()  # noqa: S311  # nosec B311
+_DELAY_SLOW_URLS = tuple(f"/api/delay/slow{chain}" for chain in _CHAIN_POOL)
+_DELAY_MED_URLS = tuple(f"/api/delay/med{chain}" for chain in _CHAIN_POOL)
+_DELAY_FAST_URLS = tuple(f"/api/delay/fast{chain}" for chain in _CHAIN_POOL)
+
+
+class BackendHttpUser(FastHttpUser):
     """Simulates HTTP traffic against all backend REST endpoints."""
 
     wait_time = between(1, 3)
+    connection_timeout = 10.0
+    # Covers the slowest delay chain (slow plus three chained calls) with headroom
+    network_timeout = 30.0
 
     @task(3)
     def health_check(self) -> None:
@@ -68,7 +88,9 @@ class BackendHttpUser(HttpUser):
     @task(1)
     def racing_track_generate(self) -> None:
         """Generate a procedural track with default parameters."""
-        self.client.post("/api/racing/track/generate", json={})
+        self.client.post(
+            "/api/racing/track/generate", data=_EMPTY_JSON_BODY, headers=_JSON_HEADERS
+        )
 
     @task(1)
     def racing_health(self) -> None:
@@ -93,17 +115,17 @@ class BackendHttpUser(HttpUser):
     @task(2)
     def delay_slow(self) -> None:
         """Slow delay endpoint with random chaining for distributed traces."""
-        self.client.get(f"/api/delay/slow{_random_call_chain()}")
+        self.client.get(_pool_random.choice(_DELAY_SLOW_URLS))
 
     @task(3)
     def delay_med(self) -> None:
         """Medium delay endpoint with random chaining for distributed traces."""
-        self.client.get(f"/api/delay/med{_random_call_chain()}")
+        self.client.get(_pool_random.choice(_DELAY_MED_URLS))
 
     @task(4)
     def delay_fast(self) -> None:
         """Fast delay endpoint with random chaining for distributed traces."""
-        self.client.get(f"/api/delay/fast{_random_call_chain()}")
+        self.client.get(_pool_random.choice(_DELAY_FAST_URLS))
 
     @task(1)
     def delay_health(self) -> None:
@@ -13,7 +13,8 @@ Overview: Imports the BackendHttpUser and OscilloscopeWebSocketUser classes into
     is sufficient for Locust's user distribution mechanism.
 
 Dependencies: locustfiles.http_users for BackendHttpUser, locustfiles.websocket_users for
-    OscilloscopeWebSocketUser, os for environment variable reading
+    OscilloscopeWebSocketUser, os for environment variable reading, Locust events and logging
+    for reporting the effective weights
 
 Exports: BackendHttpUser (re-exported with modified weight),
     OscilloscopeWebSocketUser (re-exported with modified weight)
@@ -22,13 +23,17 @@ Interfaces: HTTP_WEIGHT and WS_WEIGHT environment variables control user distrib
 
 Implementation: Uses the same sys.path manipulation pattern as websocket_users.py to ensure
     the lib package is importable. Imports both User classes and sets their weight class
-    attributes from environment variables before Locust performs module introspection.
+    attributes from environment variables before Locust performs module introspection. A
+    test_start listener logs the weights in effect for each run.
 """
 
+import logging
 import os
 import sys
 from pathlib import Path
 
+from locust import events
+
 # Add load-testing root to path so lib package and sibling locustfiles are importable
 _load_testing_root = str(Path(__file__).resolve().parent.parent)
 if _load_testing_root not in sys.path:
@@ -39,3 +44,15 @@ from locustfiles.websocket_users import OscilloscopeWebSocketUser
 
 BackendHttpUser.weight = int(os.environ.get("HTTP_WEIGHT", "70"))
 OscilloscopeWebSocketUser.weight = int(os.environ.get("WS_WEIGHT", "30"))
+
+logger = logging.getLogger(__name__)
+
+
+@events.test_start.add_listener
+def log_user_weights(**_kwargs: object) -> None:
+    """Log the effective HTTP/WebSocket weights so results can be tied to the ratio used."""
+    logger.info(
+        "Mixed scenario weights: BackendHttpUser=%d, OscilloscopeWebSocketUser=%d",
+        BackendHttpUser.weight,
+        OscilloscopeWebSocketUser.weight,
+    )
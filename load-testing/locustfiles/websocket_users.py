@@ -3,12 +3,13 @@ Purpose: WebSocket load test scenario exercising the oscilloscope streaming endp
 
 Scope: Locust custom User class for WebSocket protocol testing against the oscilloscope API
 
-Overview: Defines an OscilloscopeWebSocketUser class that exercises the full oscilloscope
-    WebSocket protocol sequence: connect, start streaming, receive data frames, reconfigure
-    parameters, receive additional frames, stop streaming, and disconnect. Each protocol step
-    reports timing metrics to the Locust event system via the LocustWebSocketClient wrapper,
-    enabling WebSocket statistics alongside HTTP metrics in the Locust UI. Uses the websockets
-    sync client, which cooperates with gevent monkey-patching through standard Python sockets.
+Overview: Defines an OscilloscopeWebSocketUser class that exercises the oscilloscope
+    WebSocket protocol sequence over a long-lived connection, as a browser client would: start
+    streaming, receive data frames, reconfigure parameters, receive additional frames, and stop
+    streaming, reconnecting only after a failure. Each protocol step reports timing metrics to
+    the Locust event system via the LocustWebSocketClient wrapper, enabling WebSocket
+    statistics alongside HTTP metrics in the Locust UI. Uses the websockets sync client, which
+    cooperates with gevent monkey-patching through standard Python sockets.
 
 Dependencies: Locust framework (User, task, between), lib.websocket_client for WebSocket
     communication and Locust event reporting
@@ -18,8 +19,11 @@ Exports: OscilloscopeWebSocketUser class for use by Locust master/worker process
 Interfaces: WebSocket endpoint /api/oscilloscope/stream with JSON command protocol
     (start, configure, stop)
 
-Implementation: Single task executing a full protocol cycle per iteration. Early return on
-    connection or receive failure (already reported to Locust). Finally block ensures disconnect.
+Implementation: Single task executing one protocol cycle per iteration on a connection opened
+    lazily and closed in on_stop. The stream URL is resolved once per user and the fixed
+    commands are JSON-encoded once at import. Frames left queued from the previous stream are
+    drained before each START so receive timings only cover fresh frames. Any failed step
+    (already reported to Locust) closes the connection so the next cycle reconnects.
     To run: set LOCUST_LOCUSTFILE=locustfiles/websocket_users.py
 """
 
@@ -33,68 +37,86 @@ _load_testing_root = str(Path(__file__).resolve().parent.parent)
 if _load_testing_root not in sys.path:
     sys.path.insert(0, _load_testing_root)
 
-from lib.websocket_client import LocustWebSocketClient, http_to_ws_url
+from lib.websocket_client import LocustWebSocketClient, encode_json, http_to_ws_url
 
 FRAMES_AFTER_START = 5
 FRAMES_AFTER_CONFIGURE = 3
 WS_STREAM_PATH = "/api/oscilloscope/stream"
 
+# Protocol commands never change between cycles, so they are encoded once at import
+START_COMMAND = encode_json(
+    {
+        "command": "start",
+        "wave_type": "sine",
+        "frequency": 10.0,
+        "amplitude": 1.0,
+        "offset": 0.0,
+    }
+)
+CONFIGURE_COMMAND = encode_json(
+    {
+        "command": "configure",
+        "frequency": 25.0,
+        "amplitude": 2.0,
+    }
+)
+STOP_COMMAND = encode_json({"command": "stop"})
+
 
 class OscilloscopeWebSocketUser(User):
     """Simulates WebSocket traffic against the oscilloscope streaming endpoint.
 
-    Each task iteration executes one full protocol cycle: connect, start,
-    receive frames, reconfigure, receive frames, stop, disconnect.
+    Each task iteration executes one protocol cycle on a persistent connection:
+    start, receive frames, reconfigure, receive frames, stop. The connection is
+    reopened only after a failed step.
     """
 
     wait_time = between(2, 5)
 
     def on_start(self) -> None:
-        """Create the WebSocket client instance for this simulated user."""
+        """Create the WebSocket client and resolve the stream URL for this simulated user."""
         self.ws_client = LocustWebSocketClient()
+        self.ws_url = http_to_ws_url(self.host, WS_STREAM_PATH)
+
+    def on_stop(self) -> None:
+        """Close the persistent WebSocket connection when the user stops."""
+        self.ws_client.close(name="ws disconnect")
 
     @task
     def oscilloscope_protocol_cycle(self) -> None:
-        """Execute one full oscilloscope WebSocket protocol cycle."""
-        ws_url = http_to_ws_url(self.host, WS_STREAM_PATH)
-
-        try:
-            if not self.ws_client.connect(ws_url, name="ws connect"):
-                return
-
-            if not self.ws_client.send_json(
-                {
-                    "command": "start",
-                    "wave_type": "sine",
-                    "frequency": 10.0,
-                    "amplitude": 1.0,
-                    "offset": 0.0,
-                },
-                name="ws start",
-            ):
-                return
-
-            for _ in range(FRAMES_AFTER_START):
-                if self.ws_client.receive_json(name="ws receive_frame") is None:
-                    return
-
-            if not self.ws_client.send_json(
-                {
-                    "command": "configure",
-                    "frequency": 25.0,
-                    "amplitude": 2.0,
-                },
-                name="ws configure",
-            ):
-                return
-
-            for _ in range(FRAMES_AFTER_CONFIGURE):
-                if self.ws_client.receive_json(name="ws receive_frame") is None:
-                    return
-
-            self.ws_client.send_json(
-                {"command": "stop"},
-                name="ws stop",
-            )
-        finally:
+        """Execute one oscilloscope protocol cycle on the user's persistent connection.
+
+        Connects lazily when no connection is open. A failed step closes the
+        connection so the next cycle starts from a fresh handshake.
+        """
+        if not self.ws_client.is_connected and not self.ws_client.connect(
+            self.ws_url, name="ws connect"
+        ):
+            return
+
+        if not self._stream_cycle():
             self.ws_client.close(name="ws disconnect")
+
+    def _stream_cycle(self) -> bool:
+        """Run start, receive, configure, receive, stop; return False on the first failure.
+
+        Frames the server sent before the previous STOP took effect are still queued
+        on the persistent connection, so they are drained first; otherwise they would
+        be read as the new stream's first frames and report near-zero latency.
+        """
+        if not self.ws_client.drain():
+            return False
+
+        if not self.ws_client.send_text(START_COMMAND, name="ws start"):
+            return False
+
+        if self.ws_client.receive_batch(FRAMES_AFTER_START, name="ws receive_frame") is None:
+            return False
+
+        if not self.ws_client.send_text(CONFIGURE_COMMAND, name="ws configure"):
+            return False
+
+        if self.ws_client.receive_batch(FRAMES_AFTER_CONFIGURE, name="ws receive_frame") is None:
+            return False
+
+        return self.ws_client.send_text(STOP_COMMAND, name="ws stop")